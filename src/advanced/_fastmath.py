@@ -0,0 +1,62 @@
+"""
+Scalar rounding helpers for the order placement path
+
+Plain float arithmetic, so the hot path avoids Decimal construction and
+string round-trips.
+"""
+
+import math
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+# Powers of ten by precision; exchange precisions are 0-8, the rest is headroom
+_POW10 = tuple(10.0 ** i for i in range(19))
+
+# Float noise tolerated when a minimum falls exactly on a step (0.002 * 50000 may land a hair under 100)
+_EPSILON = 1e-9
+
+def round_and_check(qty: float, limit_price: float, stop_price: float,
+                    qty_precision: int, price_precision: int,
+                    min_notional: float) -> tuple[float, float, float, bool]:
+    """
+    Round an order to exchange precision, raising qty to meet the minimum notional
+    
+    Args:
+        qty: Requested quantity
+        limit_price: Limit price
+        stop_price: Stop (trigger) price
+        qty_precision: Decimal places allowed for quantity
+        price_precision: Decimal places allowed for price
+        min_notional: Minimum order value
+    
+    Returns:
+        (qty_rounded, limit_price_rounded, stop_price_rounded, meets_min_notional)
+    """
+    qty_rounded = round(qty, qty_precision)
+    limit_price_rounded = round(limit_price, price_precision)
+    stop_price_rounded = round(stop_price, price_precision)
+    
+    if qty_rounded * limit_price_rounded < min_notional:
+        # Smallest quantity step meeting the minimum (ceiling division, as grid/OCO/TWAP round up)
+        qty_scale = _POW10[qty_precision]
+        qty_rounded = round(math.ceil(min_notional / limit_price_rounded * qty_scale - _EPSILON) / qty_scale, qty_precision)
+    
+    return qty_rounded, limit_price_rounded, stop_price_rounded, qty_rounded * limit_price_rounded >= min_notional - _EPSILON
+
+def round_and_check_many(qty, limit_price, stop_price, qty_precision, price_precision, min_notional: float):
+    """
+    Vectorised round_and_check over NumPy arrays, one element per order
+    
+    Returns:
+        (qty_rounded, limit_price_rounded, stop_price_rounded, meets_min_notional) arrays
+    """
+    qty_scale = 10.0 ** qty_precision
+    price_scale = 10.0 ** price_precision
+    qty_rounded = np.rint(qty * qty_scale) / qty_scale
+    limit_price_rounded = np.rint(limit_price * price_scale) / price_scale
+    stop_price_rounded = np.rint(stop_price * price_scale) / price_scale
+    
+    # Raise short orders to the smallest quantity step meeting the minimum
+    short = qty_rounded * limit_price_rounded < min_notional
+    qty_rounded = np.where(short, np.ceil(min_notional / limit_price_rounded * qty_scale - _EPSILON) / qty_scale, qty_rounded)
+    
+    return qty_rounded, limit_price_rounded, stop_price_rounded, qty_rounded * limit_price_rounded >= min_notional - _EPSILON
@@ -1,6 +1,7 @@
-import time
-from decimal import Decimal
-from ..client import BinanceFuturesClient
+import asyncio
+import json
+import numpy as np  # pyright: ignore[reportMissingImports]
+from ..client import AsyncBinanceFuturesClient, BinanceFuturesClient, get_shared_client, is_definite_rejection
 from ..validators import OrderValidator
 from ..logger import logger
 
@@ -10,14 +11,25 @@ class GridOrder:
     Automated buy-low/sell-high within a price range
     """
     
+    BATCH_SIZE = 5  # Binance futures batchOrders accepts at most 5 orders per request
+    MAX_CONCURRENCY = 8  # Batch requests in flight at once
+    
     def __init__(self, client: BinanceFuturesClient = None):
-        self.client = client or BinanceFuturesClient()
+        self.client = client or get_shared_client()
+        self.async_client = AsyncBinanceFuturesClient(testnet=self.client.testnet)
         self.validator = OrderValidator()
     
     def execute(self, symbol: str, lower_price: str, upper_price: str,
                 grid_levels: int, quantity_per_level: str):
+        """Execute a grid order (synchronous wrapper around execute_async)"""
+        return asyncio.run(self.execute_async(
+            symbol, lower_price, upper_price, grid_levels, quantity_per_level
+        ))
+    
+    async def execute_async(self, symbol: str, lower_price: str, upper_price: str,
+                            grid_levels: int, quantity_per_level: str):
         """
-        Execute a grid order
+        Execute a grid order, submitting all levels over one async session
         
         Args:
             symbol: Trading symbol (e.g., BTCUSDT)
@@ -28,90 +40,93 @@ class GridOrder:
         """
         
         # Validate inputs
-        is_valid, error_msg = self.validator.validate_symbol(symbol)
-        if not is_valid:
-            return {"success": False, "error": error_msg}
-        
-        lower, error_msg = self.validator.validate_price(lower_price)
-        if lower is None:
-            return {"success": False, "error": error_msg}
-        
-        upper, error_msg = self.validator.validate_price(upper_price)
-        if upper is None:
-            return {"success": False, "error": error_msg}
-        
-        if lower >= upper:
-            return {"success": False, "error": "Lower price must be less than upper price"}
-        
-        if grid_levels < 2:
-            return {"success": False, "error": "Grid levels must be at least 2"}
-        
-        qty, error_msg = self.validator.validate_quantity(quantity_per_level)
-        if qty is None:
+        params, error_msg = self.validator.validate_grid(
+            symbol, lower_price, upper_price, grid_levels, quantity_per_level
+        )
+        if params is None:
             return {"success": False, "error": error_msg}
+        symbol, lower, upper, qty = params.symbol, params.lower, params.upper, params.quantity
         
         try:
-            # Get current price and precision
-            current_price = Decimal(str(self.client.get_price(symbol)))
-            price_precision = self.client.get_price_precision(symbol)
-            qty_precision = self.client.get_quantity_precision(symbol)
+            # Get current price and precision (cached REST lookups, run off the event loop)
+            current_price = await asyncio.to_thread(self.client.get_price, symbol)
+            price_precision, qty_precision, _, _ = await asyncio.to_thread(self.client.get_symbol_precision, symbol)
+            
+            # Work in integer price ticks and quantity steps; convert back only for the API payload
+            price_scale = 10 ** price_precision
+            qty_scale = 10 ** qty_precision
+            current_t = round(current_price * price_scale)
+            lower_t = round(float(lower) * price_scale)
+            upper_t = round(float(upper) * price_scale)
+            qty_t = round(float(qty) * qty_scale)
+            
+            if lower_t <= 0:
+                return {"success": False, "error": f"Lower price must be at least one tick (${1 / price_scale})"}
             
             # Validate current price is within range
-            if current_price < lower or current_price > upper:
+            if current_t < lower_t or current_t > upper_t:
                 logger.warning(
-                    f"Current price (${current_price}) is outside grid range "
-                    f"(${lower} - ${upper}). Grid will still be placed."
+                    "Current price ($%s) is outside grid range ($%s - $%s). Grid will still be placed.",
+                    current_price, lower, upper
                 )
             
-            # Calculate grid prices
-            price_step = (upper - lower) / (grid_levels - 1)
-            grid_prices = [lower + (price_step * i) for i in range(grid_levels)]
+            # Calculate evenly spaced grid prices in whole ticks
+            grid_ticks = np.rint(np.linspace(lower_t, upper_t, grid_levels)).astype(np.int64)
             
-            # Round prices
-            grid_prices = [round(float(p), price_precision) for p in grid_prices]
-            
-            # Round quantity
-            qty_rounded = round(float(qty), qty_precision)
-            
-            # Ensure minimum notional per level
-            min_notional = float(self.validator.MIN_NOTIONAL)
-            min_qty = min_notional / min(grid_prices)
-            if qty_rounded < min_qty:
-                qty_rounded = round(min_qty, qty_precision)
-                logger.info(f"Adjusted quantity to {qty_rounded} to meet minimum notional per level")
+            # Ensure minimum notional per level (qty_t * tick is in qty_scale * price_scale units)
+            min_notional_t = int(self.validator.MIN_NOTIONAL) * qty_scale * price_scale
+            # The lowest level is the lower bound itself (linspace starts exactly at lower_t)
+            min_qty_t = -(-min_notional_t // lower_t)  # Round up to the next quantity step
+            if qty_t < min_qty_t:
+                qty_t = min_qty_t
+                logger.info("Adjusted quantity to %s to meet minimum notional per level", qty_t / qty_scale)
+            qty_rounded = qty_t / qty_scale
             
             logger.info(
-                f"Placing GRID order for {symbol}: {grid_levels} levels, "
-                f"{qty_rounded} per level, range: ${lower} - ${upper} "
-                f"(current: ${current_price})"
+                "Placing GRID order for %s: %d levels, %s per level, range: $%s - $%s (current: $%s)",
+                symbol, grid_levels, qty_rounded, lower, upper, current_price
             )
             
+            # Buy below current price, sell above; a level at the current price is skipped
+            buy_mask = grid_ticks < current_t
+            sell_mask = grid_ticks > current_t
+            grid_prices = grid_ticks / price_scale
+            level_numbers = np.arange(1, grid_levels + 1)
+            
+            # Per-level events are collected and logged once with the summary
+            event_buffer = [
+                {"event": "skipped", "price": price}
+                for price in grid_prices[~(buy_mask | sell_mask)].tolist()
+            ]
+            
+            buys = zip(level_numbers[buy_mask].tolist(), grid_prices[buy_mask].tolist())
+            sells = zip(level_numbers[sell_mask].tolist(), grid_prices[sell_mask].tolist())
+            levels = [(level, 'BUY', price) for level, price in buys]
+            levels += [(level, 'SELL', price) for level, price in sells]
+            
             orders = []
+            total_buy = total_sell = 0
             
-            # Place buy orders below current price, sell orders above
-            for i, price in enumerate(grid_prices):
-                if price < current_price:
-                    # Place buy limit order
-                    side = 'BUY'
-                    order_type = 'LIMIT'
-                elif price > current_price:
-                    # Place sell limit order
-                    side = 'SELL'
-                    order_type = 'LIMIT'
-                else:
-                    # Skip current price level
-                    logger.info(f"Skipping grid level at current price: ${price}")
-                    continue
-                
-                try:
-                    order = self.client.client.futures_create_order(
-                        symbol=symbol,
-                        side=side,
-                        type=order_type,
-                        timeInForce='GTC',
-                        quantity=qty_rounded,
-                        price=price
-                    )
+            # Fields shared by every level; only side and price vary per order
+            base_params = {
+                "symbol": symbol,
+                "type": "LIMIT",
+                "timeInForce": "GTC",
+                "quantity": f"{qty_rounded:.{qty_precision}f}"
+            }
+            
+            # Submit level chunks concurrently through the batchOrders endpoint
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+            chunks = [levels[start:start + self.BATCH_SIZE] for start in range(0, len(levels), self.BATCH_SIZE)]
+            results = await asyncio.gather(*[
+                self._place_batch(semaphore, base_params, chunk, price_precision)
+                for chunk in chunks
+            ])
+            
+            for chunk, chunk_results in zip(chunks, results):
+                for (level, side, price), order in zip(chunk, chunk_results):
+                    if order is None:
+                        continue
                     
                     orders.append({
                         "order_id": order['orderId'],
@@ -119,24 +134,25 @@ class GridOrder:
                         "price": price,
                         "quantity": qty_rounded,
                         "status": order['status'],
-                        "level": i + 1
+                        "level": level
                     })
+                    if side == 'BUY':
+                        total_buy += 1
+                    else:
+                        total_sell += 1
                     
-                    logger.info(f"Grid level {i+1}/{grid_levels}: {side} order @ ${price} - Order {order['orderId']}")
-                    
-                    # Small delay to avoid rate limits
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to place grid order at level {i+1} (${price}): {e}")
-                    continue
-            
-            total_buy = sum(1 for o in orders if o['side'] == 'BUY')
-            total_sell = sum(1 for o in orders if o['side'] == 'SELL')
+                    event_buffer.append({
+                        "event": "placed",
+                        "level": level,
+                        "side": side,
+                        "price": price,
+                        "order_id": order['orderId']
+                    })
             
             logger.info(
-                f"Grid order placed: {len(orders)} orders total "
-                f"({total_buy} buy, {total_sell} sell)"
+                "Grid order placed: %d orders total (%d buy, %d sell)",
+                len(orders), total_buy, total_sell,
+                extra={"action": "GRID_COMPLETE", "symbol": symbol, "events": event_buffer}
             )
             
             return {
@@ -145,7 +161,7 @@ class GridOrder:
                 "grid_levels": grid_levels,
                 "price_range": {"lower": float(lower), "upper": float(upper)},
                 "quantity_per_level": qty_rounded,
-                "current_price": float(current_price),
+                "current_price": current_price,
                 "orders_placed": len(orders),
                 "buy_orders": total_buy,
                 "sell_orders": total_sell,
@@ -153,5 +169,57 @@ class GridOrder:
             }
             
         except Exception as e:
-            logger.error(f"Grid order failed: {e}")
+            logger.error("Grid order failed: %s", e)
             return {"success": False, "error": str(e)}
+        finally:
+            await self.async_client.close()
+    
+    async def _place_batch(self, semaphore, base_params, chunk, price_precision):
+        """
+        Place up to BATCH_SIZE grid levels with a single batchOrders request
+        
+        Levels the batch rejected (or the whole chunk, if the exchange refused
+        the request outright) are retried one by one with futures_create_order.
+        If the outcome of the request is unknown (transport error, 5xx, -1007)
+        the chunk is reported as failed rather than risking duplicate orders.
+        
+        Returns:
+            List of order responses aligned with chunk (None for failed levels)
+        """
+        batch_orders = [
+            {**base_params, "side": side, "price": f"{price:.{price_precision}f}"}
+            for _, side, price in chunk
+        ]
+        
+        async with semaphore:
+            try:
+                await self.client.order_limiter.acquire_async(len(chunk))
+                responses = await self.async_client.call('futures_place_batch_order', batchOrders=json.dumps(batch_orders))
+            except Exception as e:
+                if not is_definite_rejection(e):
+                    logger.error(
+                        "Batch order request for %d levels ended with unknown status, not retrying "
+                        "(check open orders before re-placing): %s", len(chunk), e
+                    )
+                    return [None] * len(chunk)
+                logger.warning("Batch order request rejected, placing %d levels individually: %s", len(chunk), e)
+                responses = [None] * len(chunk)
+            
+            results = []
+            for (level, side, price), payload, response in zip(chunk, batch_orders, responses):
+                if response and 'orderId' in response:
+                    results.append(response)
+                    continue
+                
+                if response:
+                    logger.warning("Batch rejected grid level %d ($%s): %s", level, price, response.get('msg'))
+                
+                try:
+                    await self.client.order_limiter.acquire_async()
+                    order = await self.async_client.call('futures_create_order', **payload)
+                    results.append(order)
+                except Exception as e:
+                    logger.error("Failed to place grid order at level %d ($%s): %s", level, price, e)
+                    results.append(None)
+            
+            return results
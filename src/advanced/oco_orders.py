@@ -1,5 +1,9 @@
-from decimal import Decimal
-from ..client import BinanceFuturesClient
+import asyncio
+import json
+from binance import BinanceSocketManager  # pyright: ignore[reportMissingImports]
+from binance.exceptions import BinanceAPIException  # pyright: ignore[reportMissingImports]
+from ..client import AsyncBinanceFuturesClient, BinanceFuturesClient, get_shared_client
+from ..config import settings
 from ..validators import OrderValidator
 from ..logger import logger, log_order_action
 
@@ -9,14 +13,41 @@ class OCOOrder:
     Places a take-profit and stop-loss order simultaneously
     """
     
+    TERMINAL_STATUSES = ('FILLED', 'CANCELED', 'EXPIRED', 'REJECTED')
+    MONITOR_MAX_FAILURES = 5  # Stream/REST errors tolerated before a simulated OCO watcher gives up
+    MONITOR_RETRY_DELAY = 1.0  # Initial backoff in seconds, doubled after each failure
+    
     def __init__(self, client: BinanceFuturesClient = None):
-        self.client = client or BinanceFuturesClient()
+        self.client = client or get_shared_client()
+        self.async_client = AsyncBinanceFuturesClient(testnet=self.client.testnet)
         self.validator = OrderValidator()
+        self._cancel_event = None
+    
+    def cancel(self):
+        """
+        Stop a running simulated OCO monitor (the TP order is left live)
+        
+        Must be called from the event loop running execute_async; from another
+        thread use loop.call_soon_threadsafe(oco.cancel).
+        """
+        if self._cancel_event is not None:
+            self._cancel_event.set()
     
     def execute(self, symbol: str, side: str, quantity: str, 
                 take_profit_price: str, stop_loss_price: str):
+        """Execute an OCO order (synchronous wrapper around execute_async)"""
+        try:
+            return asyncio.run(self.execute_async(
+                symbol, side, quantity, take_profit_price, stop_loss_price
+            ))
+        except KeyboardInterrupt:
+            logger.warning("OCO order cancelled by user. Any placed legs are still live!")
+            return {"success": False, "error": "Cancelled by user"}
+    
+    async def execute_async(self, symbol: str, side: str, quantity: str,
+                            take_profit_price: str, stop_loss_price: str):
         """
-        Execute an OCO order (take-profit and stop-loss)
+        Execute an OCO order (take-profit and stop-loss) over one async session
         
         Args:
             symbol: Trading symbol (e.g., BTCUSDT)
@@ -29,10 +60,10 @@ class OCOOrder:
         log_order_action(logger, 'ORDER_INITIATED',
                         symbol=symbol, side=side.upper(), quantity=quantity,
                         take_profit=take_profit_price, stop_loss=stop_loss_price,
-                        order_type='OCO', message=f"OCO {side} order initiated")
+                        order_type='OCO', message="OCO %s order initiated", args=(side,))
         
         # Validate inputs
-        is_valid, error_msg = self.validator.validate_symbol(symbol)
+        is_valid, error_msg = self.validator.validate_symbol_fast(symbol, self.client.known_symbols)
         if not is_valid:
             log_order_action(logger, 'VALIDATION_FAILED',
                            symbol=symbol, error_code='INVALID_SYMBOL', message=error_msg)
@@ -63,195 +94,323 @@ class OCOOrder:
             return {"success": False, "error": error_msg}
         
         try:
-            # Get current price
-            current_price = Decimal(str(self.client.get_price(symbol)))
+            # Get current price and precision
+            current_price = await asyncio.to_thread(self.client.get_price, symbol)
+            price_precision, qty_precision, _, _ = await asyncio.to_thread(self.client.get_symbol_precision, symbol)
+            
+            # Work in integer price ticks and quantity steps; convert back only for the API payload
+            price_scale = 10 ** price_precision
+            qty_scale = 10 ** qty_precision
+            current_t = round(current_price * price_scale)
+            tp_t = round(float(tp_price) * price_scale)
+            sl_t = round(float(sl_price) * price_scale)
+            qty_t = round(float(qty) * qty_scale)
+            
+            if tp_t <= 0 or sl_t <= 0:
+                return {"success": False, "error": f"Prices must be at least one tick (${1 / price_scale})"}
             
             # Validate price logic based on side
             side_upper = side.upper()
             if side_upper == 'BUY':
                 # For buy orders: take-profit should be above current, stop-loss below
-                if tp_price <= current_price:
+                if tp_t <= current_t:
                     return {
                         "success": False,
                         "error": f"Take-profit price (${tp_price}) must be above current price (${current_price}) for BUY orders"
                     }
-                if sl_price >= current_price:
+                if sl_t >= current_t:
                     return {
                         "success": False,
                         "error": f"Stop-loss price (${sl_price}) must be below current price (${current_price}) for BUY orders"
                     }
             else:  # SELL
                 # For sell orders: take-profit should be below current, stop-loss above
-                if tp_price >= current_price:
+                if tp_t >= current_t:
                     return {
                         "success": False,
                         "error": f"Take-profit price (${tp_price}) must be below current price (${current_price}) for SELL orders"
                     }
-                if sl_price <= current_price:
+                if sl_t <= current_t:
                     return {
                         "success": False,
                         "error": f"Stop-loss price (${sl_price}) must be above current price (${current_price}) for SELL orders"
                     }
             
-            # Get precision
-            qty_precision = self.client.get_quantity_precision(symbol)
-            price_precision = self.client.get_price_precision(symbol)
-            
-            # Round values
-            qty_rounded = round(float(qty), qty_precision)
-            tp_price_rounded = round(float(tp_price), price_precision)
-            sl_price_rounded = round(float(sl_price), price_precision)
-            
-            # Ensure minimum notional
-            min_notional = float(self.validator.MIN_NOTIONAL)
-            if qty_rounded * tp_price_rounded < min_notional:
-                min_qty_needed = min_notional / tp_price_rounded
-                step = 10 ** (-qty_precision)
-                qty_rounded = ((min_qty_needed // step) + 1) * step
-                qty_rounded = round(qty_rounded, qty_precision)
-                logger.info(f"Adjusted quantity to {qty_rounded} to meet minimum notional requirement")
+            # Ensure minimum notional (qty_t * tp_t is in qty_scale * price_scale units)
+            min_notional_t = int(self.validator.MIN_NOTIONAL) * qty_scale * price_scale
+            if qty_t * tp_t < min_notional_t:
+                qty_t = -(-min_notional_t // tp_t)  # Round up to the next quantity step
+                logger.info("Adjusted quantity to %s to meet minimum notional requirement", qty_t / qty_scale)
             
-            # Validate with rounded values
-            qty_rounded_dec = Decimal(str(qty_rounded))
-            tp_price_rounded_dec = Decimal(str(tp_price_rounded))
-            is_valid, error_msg = self.validator.validate_notional(qty_rounded_dec, tp_price_rounded_dec)
-            if not is_valid:
-                return {"success": False, "error": error_msg}
+            qty_rounded = qty_t / qty_scale
+            tp_price_rounded = tp_t / price_scale
+            sl_price_rounded = sl_t / price_scale
             
             logger.info(
-                f"Placing OCO {side} order for {qty_rounded} {symbol}: "
-                f"TP @ ${tp_price_rounded}, SL @ ${sl_price_rounded} "
-                f"(current: ${current_price})"
+                "Placing OCO %s order for %s %s: TP @ $%s, SL @ $%s (current: $%s)",
+                side, qty_rounded, symbol, tp_price_rounded, sl_price_rounded, current_price
             )
             
-            # Place take-profit limit order
-            try:
-                tp_order = self.client.client.futures_create_order(
-                    symbol=symbol,
-                    side='SELL' if side_upper == 'BUY' else 'BUY',  # Opposite side for TP
-                    type='LIMIT',
-                    timeInForce='GTC',
-                    quantity=qty_rounded,
-                    price=tp_price_rounded
-                )
-                logger.info(f"Take-profit limit order placed: {tp_order['orderId']}")
-            except Exception as tp_err:
-                logger.error(f"Failed to place take-profit order: {tp_err}")
-                return {"success": False, "error": f"TP Order failed: {tp_err}"}
+            exit_side = 'SELL' if side_upper == 'BUY' else 'BUY'  # Opposite side for TP and SL
             
-            # Place stop-loss order
-            try:
-                sl_order = self.client.client.futures_create_order(
-                    symbol=symbol,
-                    side='SELL' if side_upper == 'BUY' else 'BUY',  # Opposite side for SL
-                    type='STOP_MARKET',
-                    quantity=qty_rounded,
-                    stopPrice=sl_price_rounded
-                )
-                logger.info(f"Stop-loss order placed: {sl_order['orderId']}")
-                
-                return {
-                    "success": True,
-                    "take_profit": {
-                        "order_id": tp_order['orderId'],
-                        "price": tp_order.get('price', tp_price_rounded),
-                        "status": tp_order['status']
-                    },
-                    "stop_loss": {
-                        "order_id": sl_order['orderId'],
-                        "stop_price": sl_order.get('stopPrice', sl_price_rounded),
-                        "status": sl_order['status']
-                    },
+            # Submit both legs in a single batchOrders request. The batch is not
+            # atomic: each leg is accepted or rejected individually.
+            batch_orders = [
+                {
+                    "symbol": symbol,
+                    "side": exit_side,
+                    "type": "LIMIT",
+                    "timeInForce": "GTC",
+                    "quantity": f"{qty_rounded:.{qty_precision}f}",
+                    "price": f"{tp_price_rounded:.{price_precision}f}"
+                },
+                {
                     "symbol": symbol,
-                    "quantity": qty_rounded
+                    "side": exit_side,
+                    "type": "STOP_MARKET",
+                    "quantity": f"{qty_rounded:.{qty_precision}f}",
+                    "stopPrice": f"{sl_price_rounded:.{price_precision}f}"
                 }
-            except Exception as sl_err:
-                error_str = str(sl_err)
-                if 'code=-4120' in error_str or 'not supported' in error_str.lower():
-                    logger.warning(f"Native stop-loss not supported. Switching to SIMULATED OCO mode for the stop-loss leg.")
-                    return self._execute_simulated_oco(
-                        symbol, side_upper, qty_rounded, tp_order, sl_price_rounded
+            ]
+            await self.client.order_limiter.acquire_async(2)
+            tp_order, sl_order = await self.async_client.call('futures_place_batch_order', batchOrders=json.dumps(batch_orders))
+            client = await self.async_client.get_client()
+            tp_ok = 'orderId' in tp_order
+            sl_ok = 'orderId' in sl_order
+            
+            if not tp_ok:
+                tp_err = f"code={tp_order.get('code')}, {tp_order.get('msg')}"
+                logger.error("Failed to place take-profit order: %s", tp_err)
+                # Don't leave a lone stop-loss behind
+                if sl_ok:
+                    try:
+                        await client.futures_cancel_order(symbol=symbol, orderId=sl_order['orderId'])
+                    except:
+                        pass
+                return {"success": False, "error": f"TP Order failed: {tp_err}"}
+            
+            logger.info("Take-profit limit order placed: %s", tp_order['orderId'])
+            
+            if not sl_ok and self._is_unsupported(sl_order):
+                # Retry as a reduce-only stop on mark price so the exchange still holds the SL
+                logger.warning("Stop-loss rejected: %s. Retrying as reduce-only STOP_MARKET on mark price.",
+                               sl_order.get('msg'))
+                try:
+                    await self.client.order_limiter.acquire_async()
+                    sl_order = await self.async_client.call(
+                        'futures_create_order',
+                        symbol=symbol,
+                        side=exit_side,
+                        type='STOP_MARKET',
+                        quantity=batch_orders[1]['quantity'],
+                        stopPrice=batch_orders[1]['stopPrice'],
+                        reduceOnly='true',
+                        workingType='MARK_PRICE'
+                    )
+                    sl_ok = True
+                except Exception as e:
+                    # Any failure falls through to cancelling the TP below
+                    if isinstance(e, BinanceAPIException):
+                        sl_order = {'code': e.code, 'msg': e.message}
+                    else:
+                        sl_order = {'code': None, 'msg': str(e)}
+            
+            if not sl_ok:
+                sl_err = f"code={sl_order.get('code')}, {sl_order.get('msg')}"
+                if self._is_unsupported(sl_order) and settings.OCO_SIMULATED_FALLBACK:
+                    logger.warning("Native stop-loss not supported. Switching to SIMULATED OCO mode for the stop-loss leg.")
+                    return await self._execute_simulated_oco(
+                        client, symbol, side_upper, qty_rounded, tp_order, sl_price_rounded
                     )
                 
                 # If SL fails for other reasons, we should probably cancel the TP order
-                logger.error(f"Stop-loss failed: {sl_err}. Cancelling TP order for safety.")
+                logger.error("Stop-loss failed: %s. Cancelling TP order for safety.", sl_err)
                 try:
-                    self.client.client.futures_cancel_order(symbol=symbol, orderId=tp_order['orderId'])
+                    await client.futures_cancel_order(symbol=symbol, orderId=tp_order['orderId'])
                 except:
                     pass
                 return {"success": False, "error": f"SL Order failed: {sl_err}"}
+            
+            logger.info("Stop-loss order placed: %s", sl_order['orderId'])
+            
+            return {
+                "success": True,
+                "take_profit": {
+                    "order_id": tp_order['orderId'],
+                    "price": tp_order.get('price', tp_price_rounded),
+                    "status": tp_order['status']
+                },
+                "stop_loss": {
+                    "order_id": sl_order['orderId'],
+                    "stop_price": sl_order.get('stopPrice', sl_price_rounded),
+                    "status": sl_order['status']
+                },
+                "symbol": symbol,
+                "quantity": qty_rounded
+            }
         except Exception as e:
-            logger.error(f"OCO execution failed: {e}")
+            logger.error("OCO execution failed: %s", e)
             return {"success": False, "error": str(e)}
+        finally:
+            await self.async_client.close()
 
-    def _execute_simulated_oco(self, symbol, side, quantity, tp_order, sl_price):
+    @staticmethod
+    def _is_unsupported(response):
+        """Check whether a rejected order response means the order type is unsupported"""
+        return response.get('code') == -4120 or 'not supported' in str(response.get('msg', '')).lower()
+    
+    async def _execute_simulated_oco(self, client, symbol, side, quantity, tp_order, sl_price):
         """
-        Monitor price to simulate an OCO (cancel TP if SL hit, or vice versa)
+        Simulate an OCO (cancel TP if SL hit, or vice versa) from WebSocket streams
+        
+        The TP fill is detected from the futures user-data stream and the SL
+        trigger from the mark price stream; REST is only used to cancel the TP
+        and place the market stop-loss once triggered.
         """
-        import time
         tp_id = tp_order['orderId']
-        logger.info(f"Monitoring OCO for {symbol}: TP Order {tp_id}, SL trigger ${sl_price}")
+        logger.info("Monitoring OCO for %s: TP Order %s, SL trigger $%s", symbol, tp_id, sl_price)
+        
+        # Created per run: asyncio primitives bind to the loop they are first awaited in
+        self._cancel_event = asyncio.Event()
         
         try:
-            while True:
-                # 1. Check if TP order was filled
-                try:
-                    current_tp = self.client.client.futures_get_order(symbol=symbol, orderId=tp_id)
-                    if current_tp['status'] == 'FILLED':
-                        logger.info(f"OCO SUCCESS: Take-profit order {tp_id} filled. OCO complete.")
-                        return {
-                            "success": True,
-                            "mode": "simulated_oco",
-                            "status": "TP_FILLED",
-                            "tp_order_id": tp_id
-                        }
-                    if current_tp['status'] in ['CANCELED', 'EXPIRED', 'REJECTED']:
-                        logger.warning(f"Take-profit order {tp_id} was {current_tp['status']}. Stopping OCO.")
-                        return {"success": False, "error": f"TP Order {current_tp['status']}"}
-                except Exception as e:
-                    logger.warning(f"Could not check TP order status: {e}")
-                
-                # 2. Check if SL price hit
-                current_price = Decimal(str(self.client.get_price(symbol)))
-                
-                sl_triggered = False
-                if side == 'BUY':
-                    if current_price <= sl_price:
-                        sl_triggered = True
-                else: # SELL
-                    if current_price >= sl_price:
-                        sl_triggered = True
-                
-                if sl_triggered:
-                    logger.info(f"SL TRIGGERED: Price reached ${current_price}. Cancelling TP order {tp_id} and placing market SL...")
-                    
-                    # Cancel TP
-                    try:
-                        self.client.client.futures_cancel_order(symbol=symbol, orderId=tp_id)
-                    except Exception as e:
-                        logger.error(f"Failed to cancel TP order during SL trigger: {e}")
-                    
-                    # Place market SL
-                    order = self.client.client.futures_create_order(
-                        symbol=symbol,
-                        side='SELL' if side == 'BUY' else 'BUY',
-                        type='MARKET',
-                        quantity=quantity
-                    )
-                    
-                    logger.info(f"OCO SL Executed: Market order {order['orderId']} placed.")
+            event, value = await self._watch_oco(client, symbol, side, tp_id, sl_price)
+            
+            if event == 'CANCEL':
+                logger.warning("Simulated OCO cancelled. TP order is still live!")
+                return {"success": False, "error": "Cancelled"}
+            
+            if event == 'TP':
+                if value == 'FILLED':
+                    logger.info("OCO SUCCESS: Take-profit order %s filled. OCO complete.", tp_id)
                     return {
                         "success": True,
                         "mode": "simulated_oco",
-                        "status": "SL_TRIGGERED",
-                        "sl_order_id": order['orderId']
+                        "status": "TP_FILLED",
+                        "tp_order_id": tp_id
                     }
+                logger.warning("Take-profit order %s was %s. Stopping OCO.", tp_id, value)
+                return {"success": False, "error": f"TP Order {value}"}
+            
+            logger.info("SL TRIGGERED: Mark price reached $%s. Cancelling TP order %s and placing market SL...", value, tp_id)
+            
+            # Cancel TP
+            try:
+                await client.futures_cancel_order(symbol=symbol, orderId=tp_id)
+            except Exception as e:
+                logger.error("Failed to cancel TP order during SL trigger: %s", e)
+            
+            # Place market SL
+            order = await client.futures_create_order(
+                symbol=symbol,
+                side='SELL' if side == 'BUY' else 'BUY',
+                type='MARKET',
+                quantity=quantity
+            )
+            
+            logger.info("OCO SL Executed: Market order %s placed.", order['orderId'])
+            return {
+                "success": True,
+                "mode": "simulated_oco",
+                "status": "SL_TRIGGERED",
+                "sl_order_id": order['orderId']
+            }
                 
-                time.sleep(5)
-                
-        except KeyboardInterrupt:
+        except asyncio.CancelledError:
             logger.warning("Simulated OCO cancelled by user. TP order is still live!")
-            return {"success": False, "error": "Cancelled by user"}
+            raise
         except Exception as e:
-            logger.error(f"Simulated OCO error: {e}")
+            logger.error("Simulated OCO error: %s", e)
             return {"success": False, "error": f"Simulation failed: {e}"}
+    
+    async def _watch_oco(self, client, symbol, side, tp_id, sl_price):
+        """
+        Wait until the TP order finishes or the mark price crosses the SL trigger
+        
+        Returns:
+            ('TP', final_status), ('SL', mark_price) or ('CANCEL', None),
+            whichever happens first
+        """
+        socket_manager = BinanceSocketManager(client)
+        
+        tasks = [
+            asyncio.create_task(self._with_retries('TP', self._wait_for_tp, client, socket_manager, symbol, tp_id)),
+            asyncio.create_task(self._with_retries('SL', self._wait_for_sl, socket_manager, symbol, side, sl_price)),
+            asyncio.create_task(self._wait_for_cancel())
+        ]
+        
+        # Every waiter is cancelled and awaited before returning, so none outlives the monitor
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return done.pop().result()
+    
+    async def _with_retries(self, name, waiter, *args):
+        """
+        Run a watcher, reopening it with exponential backoff after transient errors
+        
+        Reopening the TP watcher re-checks the order over REST, so fills that
+        happened while the stream was down are not missed.
+        """
+        failures = 0
+        while True:
+            try:
+                return await waiter(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                if failures >= self.MONITOR_MAX_FAILURES:
+                    logger.error("%s watcher failed %d times, giving up: %s", name, failures, e)
+                    raise
+                delay = self.MONITOR_RETRY_DELAY * 2 ** (failures - 1)
+                logger.warning("%s watcher error (%s), retrying in %.1fs", name, e, delay)
+                await asyncio.sleep(delay)
+    
+    async def _wait_for_cancel(self):
+        """Wait for cancel() to be called"""
+        await self._cancel_event.wait()
+        return 'CANCEL', None
+    
+    async def _wait_for_tp(self, client, socket_manager, symbol, tp_id):
+        """Wait for ORDER_TRADE_UPDATE events moving the TP order to a final status"""
+        async with socket_manager.futures_user_socket() as stream:
+            # The order may already have finished before the stream was opened
+            order = await client.futures_get_order(symbol=symbol, orderId=tp_id)
+            if order['status'] in self.TERMINAL_STATUSES:
+                return 'TP', order['status']
+            
+            while True:
+                msg = await stream.recv()
+                if msg.get('e') == 'error':
+                    raise RuntimeError(f"User data stream error: {msg.get('m')}")
+                if msg.get('e') != 'ORDER_TRADE_UPDATE':
+                    continue
+                
+                update = msg['o']
+                if update['i'] == tp_id and update['X'] in self.TERMINAL_STATUSES:
+                    return 'TP', update['X']
+    
+    async def _wait_for_sl(self, socket_manager, symbol, side, sl_price):
+        """Wait for a mark price update that crosses the SL trigger"""
+        async with socket_manager.symbol_mark_price_socket(symbol, fast=True) as stream:
+            while True:
+                msg = await stream.recv()
+                if msg.get('e') == 'error':
+                    raise RuntimeError(f"Mark price stream error: {msg.get('m')}")
+                # Futures symbol streams arrive wrapped as {"stream": ..., "data": {...}}
+                msg = msg.get('data', msg)
+                if 'p' not in msg:
+                    continue
+                
+                mark_price = float(msg['p'])
+                if side == 'BUY':
+                    if mark_price <= sl_price:
+                        return 'SL', mark_price
+                else: # SELL
+                    if mark_price >= sl_price:
+                        return 'SL', mark_price
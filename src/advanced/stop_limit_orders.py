@@ -1,16 +1,131 @@
-from decimal import Decimal
-from ..client import BinanceFuturesClient
+import asyncio
+import json
+import operator
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import ClassVar
+import numpy as np  # pyright: ignore[reportMissingImports]
+from binance import BinanceSocketManager  # pyright: ignore[reportMissingImports]
+from binance.exceptions import BinanceAPIException  # pyright: ignore[reportMissingImports]
+from ..client import AsyncBinanceFuturesClient, BinanceFuturesClient, get_shared_client
 from ..validators import OrderValidator
 from ..logger import logger, log_order_action
+from ._fastmath import round_and_check, round_and_check_many
+
+# Interned side constants; validated sides are always one of these values
+_BUY = sys.intern('BUY')
+_SELL = sys.intern('SELL')
+
+# Per side: (stop vs current price check, limit vs stop price check, and their wording).
+# BUY stops trigger above the market with limit >= stop; SELL stops mirror that.
+_SIDE_RULES = {
+    _BUY: (operator.gt, operator.ge, "above", ">="),
+    _SELL: (operator.lt, operator.le, "below", "<="),
+}
+
+def _stop_params(symbol, side, quantity, limit_price, stop_price):
+    """STOP: stop-limit order (limit order placed at the trigger)"""
+    return {'symbol': symbol, 'side': side, 'type': 'STOP', 'timeInForce': 'GTC',
+            'quantity': quantity, 'price': limit_price, 'stopPrice': stop_price}
+
+def _stop_market_params(symbol, side, quantity, limit_price, stop_price):
+    """STOP_MARKET: market order placed at the trigger"""
+    return {'symbol': symbol, 'side': side, 'type': 'STOP_MARKET',
+            'quantity': quantity, 'stopPrice': stop_price, 'closePosition': False}
+
+def _stop_loss_limit_params(symbol, side, quantity, limit_price, stop_price):
+    """STOP_LOSS_LIMIT: stop-limit type used by some API versions"""
+    return {'symbol': symbol, 'side': side, 'type': 'STOP_LOSS_LIMIT', 'timeInForce': 'GTC',
+            'quantity': quantity, 'price': limit_price, 'stopPrice': stop_price}
+
+# Stop order types to try, in order of preference
+_STOP_ATTEMPTS = (
+    ('STOP', _stop_params),
+    ('STOP_MARKET', _stop_market_params),
+    ('STOP_LOSS_LIMIT', _stop_loss_limit_params),
+)
+
+# Rejections of the order type itself, where another stop type may still work:
+# -4120 use the Algo Order API, -1116 invalid order type, -1106 parameter not allowed for the type
+_UNSUPPORTED_CODES = frozenset({-4120, -1116, -1106})
+
+@dataclass(slots=True)
+class OrderResult:
+    """
+    Outcome of a stop-limit order, used internally
+    
+    The public execute methods return as_dict(), the same plain dicts (with
+    unset fields left out) that the other order types return.
+    """
+    success: bool
+    order_id: int | None = None
+    symbol: str | None = None
+    side: str | None = None
+    quantity: float | str | None = None
+    limit_price: float | str | None = None
+    stop_price: float | str | None = None
+    status: str | None = None
+    mode: str | None = None
+    error: str | None = None
+    
+    @classmethod
+    def from_order(cls, order: dict, limit_price: float, stop_price: float) -> "OrderResult":
+        """Build a successful result from an exchange order response"""
+        return cls(
+            success=True,
+            order_id=order['orderId'],
+            symbol=order['symbol'],
+            side=order['side'],
+            quantity=order['origQty'],
+            limit_price=order.get('price', limit_price),
+            stop_price=order.get('stopPrice', stop_price),
+            status=order['status']
+        )
+    
+    def get(self, key: str, default=None):
+        """Dict-style field access, returning default for unset fields"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+    
+    def as_dict(self) -> dict:
+        """Plain dict of the set fields, for JSON output"""
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name) is not None}
 
 class StopLimitOrder:
     """Handle stop-limit orders (trigger a limit order when stop price is hit)"""
     
+    BATCH_SIZE = 5  # Binance futures batchOrders accepts at most 5 orders per request
+    validator: ClassVar[OrderValidator] = OrderValidator()  # Stateless, shared by all instances
+    UNSUPPORTED_TTL = 3600  # Seconds before rejected stop types are tried again
+    
+    # symbol -> (recorded_at, {order type: rejection code}), shared by all instances
+    _unsupported_types: dict[str, tuple[float, dict[str, int]]] = {}
+    
     def __init__(self, client: BinanceFuturesClient = None):
-        self.client = client or BinanceFuturesClient()
-        self.validator = OrderValidator()
+        self.client = client or get_shared_client()
+        self.async_client = AsyncBinanceFuturesClient(testnet=self.client.testnet)
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Stop a running simulated stop-limit monitor (safe to call from any thread)"""
+        self._cancel_event.set()
     
     def execute(self, symbol: str, side: str, quantity: str, limit_price: str, stop_price: str):
+        """Execute a stop-limit order (synchronous wrapper around execute_async)"""
+        try:
+            return asyncio.run(self.execute_async(symbol, side, quantity, limit_price, stop_price))
+        except KeyboardInterrupt:
+            logger.warning("Stop-limit order cancelled by user.")
+            return OrderResult(success=False, error="Cancelled by user").as_dict()
+    
+    async def execute_async(self, symbol: str, side: str, quantity: str, limit_price: str, stop_price: str) -> dict:
+        """Execute a stop-limit order, returning the result as a plain dict"""
+        result = await self._execute_async(symbol, side, quantity, limit_price, stop_price)
+        return result.as_dict()
+    
+    async def _execute_async(self, symbol: str, side: str, quantity: str, limit_price: str, stop_price: str) -> OrderResult:
         """
         Execute a stop-limit order
         
@@ -25,195 +140,105 @@ class StopLimitOrder:
         log_order_action(logger, 'ORDER_INITIATED',
                         symbol=symbol, side=side.upper(), quantity=quantity,
                         limit_price=limit_price, stop_price=stop_price,
-                        order_type='STOP_LIMIT', message=f"Stop-limit {side} order initiated")
+                        order_type='STOP_LIMIT', message="Stop-limit %s order initiated", args=(side,))
         
-        # Validate inputs
-        is_valid, error_msg = self.validator.validate_symbol(symbol)
+        # Validate all inputs in one pass (cheap checks first)
+        is_valid, parsed = self.validator.validate_stop_limit(
+            symbol, side, quantity, limit_price, stop_price, self.client.known_symbols
+        )
         if not is_valid:
             log_order_action(logger, 'VALIDATION_FAILED',
-                           symbol=symbol, error_code='INVALID_SYMBOL', message=error_msg)
-            return {"success": False, "error": error_msg}
-        
-        is_valid, error_msg = self.validator.validate_side(side)
-        if not is_valid:
-            log_order_action(logger, 'VALIDATION_FAILED',
-                           symbol=symbol, side=side, error_code='INVALID_SIDE', message=error_msg)
-            return {"success": False, "error": error_msg}
-        
-        qty, error_msg = self.validator.validate_quantity(quantity)
-        if qty is None:
-            log_order_action(logger, 'VALIDATION_FAILED',
-                           symbol=symbol, quantity=quantity, error_code='INVALID_QUANTITY', message=error_msg)
-            return {"success": False, "error": error_msg}
-        
-        limit_price_dec, error_msg = self.validator.validate_price(limit_price)
-        if limit_price_dec is None:
-            log_order_action(logger, 'VALIDATION_FAILED',
-                           symbol=symbol, price=limit_price, error_code='INVALID_LIMIT_PRICE', message=error_msg)
-            return {"success": False, "error": error_msg}
-        
-        stop_price_dec, error_msg = self.validator.validate_price(stop_price)
-        if stop_price_dec is None:
-            log_order_action(logger, 'VALIDATION_FAILED',
-                           symbol=symbol, price=stop_price, error_code='INVALID_STOP_PRICE', message=error_msg)
-            return {"success": False, "error": error_msg}
+                           symbol=symbol, side=side, error_code=parsed['error_code'], message=parsed['error'])
+            return OrderResult(success=False, error=parsed['error'])
+        side_upper = _BUY if parsed['side'] == _BUY else _SELL
+        qty = parsed['quantity']
+        limit_price_dec = parsed['limit_price']
+        stop_price_dec = parsed['stop_price']
         
         try:
-            # Get current price
-            current_price = Decimal(str(self.client.get_price(symbol)))
+            # Get current price and precision concurrently (cached REST lookups, run off the event loop)
+            current_price, (price_precision, qty_precision, _, _) = await asyncio.gather(
+                asyncio.to_thread(self.client.get_price, symbol),
+                asyncio.to_thread(self.client.get_symbol_precision, symbol)
+            )
             
-            # Validate stop price logic
-            side_upper = side.upper()
-            if side_upper == 'BUY':
-                # For buy stop-limit: stop price should be above current price
-                if stop_price_dec <= current_price:
-                    return {
-                        "success": False,
-                        "error": f"Stop price (${stop_price_dec}) must be above current price (${current_price}) for BUY orders"
-                    }
-                # Limit price should be at or above stop price for buy orders
-                if limit_price_dec < stop_price_dec:
-                    return {
-                        "success": False,
-                        "error": f"Limit price (${limit_price_dec}) must be >= stop price (${stop_price_dec}) for BUY orders"
-                    }
-            else:  # SELL
-                # For sell stop-limit: stop price should be below current price
-                if stop_price_dec >= current_price:
-                    return {
-                        "success": False,
-                        "error": f"Stop price (${stop_price_dec}) must be below current price (${current_price}) for SELL orders"
-                    }
-                # Limit price should be at or below stop price for sell orders
-                if limit_price_dec > stop_price_dec:
-                    return {
-                        "success": False,
-                        "error": f"Limit price (${limit_price_dec}) must be <= stop price (${stop_price_dec}) for SELL orders"
-                    }
+            # Compare and round as floats; Decimal is only kept for input validation
+            limit_price_f = float(limit_price_dec)
+            stop_price_f = float(stop_price_dec)
             
-            # Get and apply precision
-            qty_precision = self.client.get_quantity_precision(symbol)
-            price_precision = self.client.get_price_precision(symbol)
-            
-            # Round values
-            qty_rounded = round(float(qty), qty_precision)
-            limit_price_rounded = round(float(limit_price_dec), price_precision)
-            stop_price_rounded = round(float(stop_price_dec), price_precision)
+            # Validate stop price logic
+            error_msg = self._check_trigger(side_upper, current_price, limit_price_f, stop_price_f, price_precision)
+            if error_msg:
+                return OrderResult(success=False, error=error_msg)
             
-            # Ensure minimum notional
-            min_notional = float(self.validator.MIN_NOTIONAL)
-            if qty_rounded * limit_price_rounded < min_notional:
-                min_qty_needed = min_notional / limit_price_rounded
-                step = 10 ** (-qty_precision)
-                qty_rounded = ((min_qty_needed // step) + 1) * step
-                qty_rounded = round(qty_rounded, qty_precision)
-                logger.info(f"Adjusted quantity to {qty_rounded} to meet minimum notional requirement")
+            # Round values and ensure minimum notional
+            qty_f = float(qty)
+            qty_rounded, limit_price_rounded, stop_price_rounded, notional_ok = round_and_check(
+                qty_f, limit_price_f, stop_price_f,
+                qty_precision, price_precision, self.validator.MIN_NOTIONAL_F
+            )
+            if qty_rounded != round(qty_f, qty_precision):
+                logger.info("Adjusted quantity to %s to meet minimum notional requirement", qty_rounded)
             
-            # Validate with rounded values
-            qty_rounded_dec = Decimal(str(qty_rounded))
-            limit_price_rounded_dec = Decimal(str(limit_price_rounded))
-            is_valid, error_msg = self.validator.validate_notional(qty_rounded_dec, limit_price_rounded_dec)
-            if not is_valid:
-                return {"success": False, "error": error_msg}
+            if not notional_ok:
+                _, error_msg = self.validator.validate_notional_f(qty_rounded, limit_price_rounded)
+                return OrderResult(success=False, error=error_msg)
             
             log_order_action(logger, 'ORDER_PLACING',
-                           symbol=symbol, side=side.upper(), quantity=qty_rounded,
+                           symbol=symbol, side=side_upper, quantity=qty_rounded,
                            limit_price=limit_price_rounded, stop_price=stop_price_rounded,
-                           current_price=f"${current_price}", value=f"${qty_rounded * limit_price_rounded:.2f}",
-                           message=f"Placing STOP-LIMIT {side} order")
+                           current_price=current_price, value=qty_rounded * limit_price_rounded,
+                           message="Placing STOP-LIMIT %s order", args=(side_upper,))
             
             # Place stop-limit order
             # Note: Binance Futures stop-limit orders require the Algo Order API endpoint
-            # which may not be available in testnet. We'll try multiple approaches.
-            try:
-                # Approach 1: Try STOP order type (Stop-Limit)
-                try:
-                    order = self.client.client.futures_create_order(
-                        symbol=symbol,
-                        side='BUY' if side_upper == 'BUY' else 'SELL',
-                        type='STOP',
-                        timeInForce='GTC',
-                        quantity=qty_rounded,
-                        price=limit_price_rounded,
-                        stopPrice=stop_price_rounded
-                    )
-                except Exception as stop_error:
-                    error_str = str(stop_error)
-                    
-                    # If it's the specific "Algo Order API" error (-4120), try simulation
-                    if 'code=-4120' in error_str:
-                        logger.warning(f"Native stop orders not supported for this account/symbol. Switching to SIMULATED stop-limit mode.")
-                        return self._execute_simulated(
-                            symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded, current_price
+            # which may not be available in testnet. Each stop type is tried in turn.
+            order = None
+            failures = []
+            # Types already rejected for this symbol are skipped without a request
+            unsupported = self._unsupported_for(symbol)
+            for order_type, build_params in _STOP_ATTEMPTS:
+                code = unsupported.get(order_type)
+                if code is None:
+                    try:
+                        # call() backs off on 418/429, honouring Retry-After
+                        order = await self.async_client.call(
+                            'futures_create_order',
+                            **build_params(symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded)
                         )
-                    
-                    # Approach 2: Try STOP_MARKET (triggers market order, not limit)
-                    logger.debug(f"STOP order attempt failed: {error_str}")
-                    
-                    if 'not supported' in error_str or 'Algo Order' in error_str or 'STOP' in error_str or 'type' in error_str.lower():
-                        try:
-                            # Use STOP_MARKET as alternative (triggers market order at stop price)
-                            log_order_action(logger, 'ORDER_WARNING',
-                                           symbol=symbol, message=f"STOP type failed ({error_str}), trying STOP_MARKET")
-                            order = self.client.client.futures_create_order(
-                                symbol=symbol,
-                                side='BUY' if side_upper == 'BUY' else 'SELL',
-                                type='STOP_MARKET',
-                                quantity=qty_rounded,
-                                stopPrice=stop_price_rounded,
-                                closePosition=False
-                            )
-                            log_order_action(logger, 'ORDER_WARNING',
-                                           symbol=symbol, message="Using STOP_MARKET (market order) instead of STOP_LIMIT")
-                        except Exception as market_error:
-                            market_err_str = str(market_error)
-                            
-                            # If market also fails with -4120, try simulation
-                            if 'code=-4120' in market_err_str:
-                                logger.warning(f"Native stop-market orders not supported. Switching to SIMULATED stop-limit mode.")
-                                return self._execute_simulated(
-                                    symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded, current_price
-                                )
-                            
-                            logger.debug(f"STOP_MARKET order attempt failed: {market_err_str}")
-                            
-                            try:
-                                # Final attempt: try STOP_LOSS_LIMIT (used in some API versions)
-                                log_order_action(logger, 'ORDER_WARNING',
-                                               symbol=symbol, message=f"STOP_MARKET failed ({market_err_str}), trying STOP_LOSS_LIMIT")
-                                order = self.client.client.futures_create_order(
-                                    symbol=symbol,
-                                    side='BUY' if side_upper == 'BUY' else 'SELL',
-                                    type='STOP_LOSS_LIMIT',
-                                    timeInForce='GTC',
-                                    quantity=qty_rounded,
-                                    price=limit_price_rounded,
-                                    stopPrice=stop_price_rounded
-                                )
-                            except Exception as stop_loss_error:
-                                final_err_str = str(stop_loss_error)
-                                logger.error(f"Final attempt (STOP_LOSS_LIMIT) failed: {final_err_str}")
-                                # If all fail, return helpful error
-                                return {
-                                    "success": False,
-                                    "error": (
-                                        f"All stop order types failed on testnet.\n"
-                                        f"1. STOP: {error_str}\n"
-                                        f"2. STOP_MARKET: {market_err_str}\n"
-                                        f"3. STOP_LOSS_LIMIT: {final_err_str}\n"
-                                        "Note: Many advanced order types are restricted on Binance Testnet accounts."
-                                    )
-                                }
-                    else:
-                        raise
-            except Exception as e:
-                error_str = str(e)
-                if 'not supported' in error_str or 'Algo Order' in error_str:
-                    # Final fallback to simulation even if we missed a catch block
-                    return self._execute_simulated(
-                        symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded, current_price
+                        break
+                    except BinanceAPIException as e:
+                        if e.code not in _UNSUPPORTED_CODES:
+                            raise
+                        code = unsupported[order_type] = e.code
+                        failures.append((order_type, e))
+                        log_order_action(logger, 'ORDER_WARNING',
+                                       symbol=symbol, message="%s failed (%s)", args=(order_type, e))
+                else:
+                    failures.append((order_type, f"skipped, rejected earlier with code={code}"))
+                
+                # The "use the Algo Order API" error (-4120): simulate instead
+                if code == -4120:
+                    logger.warning("Native %s orders not supported for this account/symbol. Switching to SIMULATED stop-limit mode.", order_type)
+                    return await self._execute_simulated(
+                        symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded
+                    )
+            
+            if order is None:
+                logger.error("Final attempt (%s) failed: %s", *failures[-1])
+                # If all fail, return helpful error
+                attempts = "\n".join(f"{i}. {name}: {err}" for i, (name, err) in enumerate(failures, 1))
+                return OrderResult(
+                    success=False,
+                    error=(
+                        f"All stop order types failed on testnet.\n{attempts}\n"
+                        "Note: Many advanced order types are restricted on Binance Testnet accounts."
                     )
-                raise
+                )
+            
+            if order_type == 'STOP_MARKET':
+                log_order_action(logger, 'ORDER_WARNING',
+                               symbol=symbol, message="Using STOP_MARKET (market order) instead of STOP_LIMIT")
             
             log_order_action(logger, 'ORDER_PLACED',
                            order_id=str(order['orderId']), symbol=symbol, side=order['side'],
@@ -221,77 +246,246 @@ class StopLimitOrder:
                            stop_price=order.get('stopPrice', stop_price_rounded),
                            status=order['status'], message="Stop-limit order placed successfully")
             
-            return {
-                "success": True,
-                "order_id": order['orderId'],
-                "symbol": order['symbol'],
-                "side": order['side'],
-                "quantity": order['origQty'],
-                "limit_price": order.get('price', limit_price_rounded),
-                "stop_price": order.get('stopPrice', stop_price_rounded),
-                "status": order['status']
-            }
+            return OrderResult.from_order(order, limit_price_rounded, stop_price_rounded)
             
         except Exception as e:
             error_str = str(e)
+            # Filter/precision rejections mean the cached exchangeInfo may be stale
+            self.client.invalidate_symbol(symbol, e)
             log_order_action(logger, 'ORDER_FAILED',
-                           symbol=symbol, side=side.upper(), error_code='EXECUTION_ERROR',
-                           message=f"Stop-limit order failed: {error_str}")
-            return {"success": False, "error": error_str}
+                           symbol=symbol, side=side_upper, error_code='EXECUTION_ERROR',
+                           message="Stop-limit order failed: %s", args=(error_str,))
+            return OrderResult(success=False, error=error_str)
+        finally:
+            await self.async_client.close()
+
+    def execute_many(self, orders: list[dict]) -> list[dict]:
+        """
+        Place many stop-limit orders through the batchOrders endpoint
+        
+        Orders are validated one by one, rounded together, and submitted in
+        chunks of BATCH_SIZE. Orders the exchange rejects with -4120 are
+        simulated concurrently from the mark price streams.
+        
+        Args:
+            orders: Dicts with symbol, side, quantity, limit_price and stop_price
+        
+        Returns:
+            One result dict per order, in input order
+        """
+        results = [None] * len(orders)
+        pending = []  # (index, symbol, side, current_price, price_precision, qty_precision, qty, limit, stop)
+        known_symbols = self.client.known_symbols
+        
+        for index, o in enumerate(orders):
+            is_valid, parsed = self.validator.validate_stop_limit(
+                o['symbol'], o['side'], o['quantity'], o['limit_price'], o['stop_price'], known_symbols
+            )
+            if not is_valid:
+                results[index] = OrderResult(success=False, error=parsed['error'])
+                continue
+            
+            symbol = o['symbol'].upper()
+            side_upper = _BUY if parsed['side'] == _BUY else _SELL
+            try:
+                current_price = self.client.get_price(symbol)
+                price_precision, qty_precision, _, _ = self.client.get_symbol_precision(symbol)
+            except Exception as e:
+                results[index] = OrderResult(success=False, error=str(e))
+                continue
+            
+            limit_price_f = float(parsed['limit_price'])
+            stop_price_f = float(parsed['stop_price'])
+            error_msg = self._check_trigger(side_upper, current_price, limit_price_f, stop_price_f, price_precision)
+            if error_msg:
+                results[index] = OrderResult(success=False, error=error_msg)
+                continue
+            
+            pending.append((index, symbol, side_upper, current_price, price_precision, qty_precision,
+                            float(parsed['quantity']), limit_price_f, stop_price_f))
+        
+        if not pending:
+            return [result.as_dict() for result in results]
+        
+        # Round every order and check minimum notional in one vectorised pass
+        columns = np.array([entry[4:] for entry in pending], dtype=np.float64).T
+        price_precisions, qty_precisions, qtys, limit_prices, stop_prices = columns
+        qtys, limit_prices, stop_prices, notional_ok = round_and_check_many(
+            qtys, limit_prices, stop_prices, qty_precisions, price_precisions, self.validator.MIN_NOTIONAL_F
+        )
+        
+        placeable = []
+        simulated = []
+        for k, (index, symbol, side_upper, current_price, price_precision, qty_precision, *_) in enumerate(pending):
+            qty_rounded, limit_price_rounded, stop_price_rounded = float(qtys[k]), float(limit_prices[k]), float(stop_prices[k])
+            if not notional_ok[k]:
+                _, error_msg = self.validator.validate_notional_f(qty_rounded, limit_price_rounded)
+                results[index] = OrderResult(success=False, error=error_msg)
+                continue
+            if self._unsupported_for(symbol).get('STOP') == -4120:
+                # Known to need simulation; skip the request that would be rejected
+                simulated.append((index, symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded))
+                continue
+            placeable.append((index, symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded,
+                              _stop_params(symbol, side_upper, f"{qty_rounded:.{qty_precision}f}",
+                                           f"{limit_price_rounded:.{price_precision}f}",
+                                           f"{stop_price_rounded:.{price_precision}f}")))
+        
+        for start in range(0, len(placeable), self.BATCH_SIZE):
+            chunk = placeable[start:start + self.BATCH_SIZE]
+            try:
+                self.client.order_limiter.acquire(len(chunk))
+                responses = self.client.client.futures_place_batch_order(
+                    batchOrders=json.dumps([entry[-1] for entry in chunk])
+                )
+            except Exception as e:
+                logger.error("Batch stop-limit request failed: %s", e)
+                for entry in chunk:
+                    results[entry[0]] = OrderResult(success=False, error=str(e))
+                continue
+            
+            for (index, symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded, _), response in zip(chunk, responses):
+                if 'orderId' in response:
+                    results[index] = OrderResult.from_order(response, limit_price_rounded, stop_price_rounded)
+                elif response.get('code') == -4120:
+                    self._unsupported_for(symbol)['STOP'] = -4120
+                    simulated.append((index, symbol, side_upper, qty_rounded, limit_price_rounded, stop_price_rounded))
+                else:
+                    results[index] = OrderResult(success=False, error=f"code={response.get('code')}, {response.get('msg')}")
+        
+        placed = sum(1 for result in results if result and result.success)
+        logger.info("Batch stop-limit: %d/%d orders placed, %d simulated", placed, len(orders), len(simulated))
+        
+        if simulated:
+            logger.warning("Native stop orders not supported for %d orders. Simulating them concurrently.", len(simulated))
+            self._cancel_event.clear()
+            try:
+                outcomes = asyncio.run(self._simulate_many([entry[1:] for entry in simulated]))
+            except KeyboardInterrupt:
+                logger.warning("Simulated stop-limit orders cancelled by user.")
+                outcomes = [OrderResult(success=False, error="Cancelled by user")] * len(simulated)
+            for entry, outcome in zip(simulated, outcomes):
+                results[entry[0]] = outcome
+        
+        return [result.as_dict() for result in results]
+    
+    @classmethod
+    def _unsupported_for(cls, symbol: str) -> dict[str, int]:
+        """Stop types the exchange rejected for a symbol, reset every UNSUPPORTED_TTL seconds"""
+        symbol = symbol.upper()
+        entry = cls._unsupported_types.get(symbol)
+        if entry is None or time.monotonic() - entry[0] >= cls.UNSUPPORTED_TTL:
+            entry = cls._unsupported_types[symbol] = (time.monotonic(), {})
+        return entry[1]
 
-    def _execute_simulated(self, symbol, side, quantity, limit_price, stop_price, start_price):
+    @staticmethod
+    def _check_trigger(side, current_price, limit_price, stop_price, price_precision) -> str:
         """
-        Execute a simulated stop-limit order by monitoring price
+        Check the stop and limit prices against the current price for the side
+        Returns: error message, or "" if the prices are consistent
         """
-        import time
-        logger.info(f"Starting SIMULATED stop-limit order for {symbol} at ${stop_price}...")
+        stop_ok, limit_ok, direction, relation = _SIDE_RULES[side]
+        if not stop_ok(stop_price, current_price):
+            return f"Stop price (${stop_price:.{price_precision}f}) must be {direction} current price (${current_price:.{price_precision}f}) for {side} orders"
+        if not limit_ok(limit_price, stop_price):
+            return f"Limit price (${limit_price:.{price_precision}f}) must be {relation} stop price (${stop_price:.{price_precision}f}) for {side} orders"
+        return ""
+
+    async def _execute_simulated(self, symbol, side, quantity, limit_price, stop_price):
+        """
+        Execute a simulated stop-limit order by watching the mark price stream
+        
+        The trigger is checked on every markPrice@1s push; REST is only used
+        to place the limit order once the stop price is crossed.
+        """
+        self._cancel_event.clear()
         
         try:
-            while True:
-                current_price = Decimal(str(self.client.get_price(symbol)))
-                
-                triggered = False
-                if side == 'BUY':
-                    if current_price >= stop_price:
-                        triggered = True
-                else: # SELL
-                    if current_price <= stop_price:
-                        triggered = True
-                
-                if triggered:
-                    logger.info(f"STOP TRIGGERED: Price reached ${current_price}. Placing LIMIT {side} order at ${limit_price}...")
-                    
-                    # Place the actual limit order now
-                    order = self.client.client.futures_create_order(
-                        symbol=symbol,
-                        side='BUY' if side == 'BUY' else 'SELL',
-                        type='LIMIT',
-                        timeInForce='GTC',
-                        quantity=quantity,
-                        price=limit_price
-                    )
-                    
-                    logger.info(f"Simulated stop-limit executed: Limit order {order['orderId']} placed.")
-                    
-                    return {
-                        "success": True,
-                        "mode": "simulated",
-                        "order_id": order['orderId'],
-                        "symbol": symbol,
-                        "side": side,
-                        "quantity": quantity,
-                        "limit_price": limit_price,
-                        "stop_price": stop_price,
-                        "status": "TRIGGERED"
-                    }
-                
-                # Wait 5 seconds between checks
-                time.sleep(5)
-                
-        except KeyboardInterrupt:
+            return await self._simulate(symbol, side, quantity, limit_price, stop_price)
+        except asyncio.CancelledError:
             logger.warning("Simulated stop-limit order cancelled by user.")
-            return {"success": False, "error": "Cancelled by user"}
+            raise
         except Exception as e:
-            logger.error(f"Simulated stop-limit error: {e}")
-            return {"success": False, "error": f"Simulation failed: {e}"}
+            logger.error("Simulated stop-limit error: %s", e)
+            return OrderResult(success=False, error=f"Simulation failed: {e}")
+    
+    async def _simulate_many(self, entries):
+        """Run several simulated stop-limit orders concurrently (results in input order)"""
+        try:
+            await self.async_client.get_client()  # Create the shared session before fanning out
+            outcomes = await asyncio.gather(
+                *[self._simulate(*entry) for entry in entries], return_exceptions=True
+            )
+        finally:
+            await self.async_client.close()
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Simulated stop-limit error: %s", outcome)
+                outcome = OrderResult(success=False, error=f"Simulation failed: {outcome}")
+            results.append(outcome)
+        return results
+    
+    async def _simulate(self, symbol, side, quantity, limit_price, stop_price):
+        """Wait for the stop trigger, then place the limit order"""
+        logger.info("Starting SIMULATED stop-limit order for %s at $%s...", symbol, stop_price)
+        
+        current_price = await self._wait_for_trigger(symbol, side, stop_price)
+        if current_price is None:
+            logger.warning("Simulated stop-limit order cancelled.")
+            return OrderResult(success=False, error="Cancelled")
+        
+        logger.info("STOP TRIGGERED: Price reached $%s. Placing LIMIT %s order at $%s...", current_price, side, limit_price)
+        
+        # Place the actual limit order now
+        order = await self.async_client.call(
+            'futures_create_order',
+            symbol=symbol,
+            side=side,
+            type='LIMIT',
+            timeInForce='GTC',
+            quantity=quantity,
+            price=limit_price
+        )
+        
+        logger.info("Simulated stop-limit executed: Limit order %s placed.", order['orderId'])
+        
+        return OrderResult(
+            success=True,
+            mode="simulated",
+            order_id=order['orderId'],
+            symbol=symbol,
+            side=side,
+            quantity=quantity,
+            limit_price=limit_price,
+            stop_price=stop_price,
+            status="TRIGGERED"
+        )
+
+    async def _wait_for_trigger(self, symbol, side, stop_price):
+        """
+        Wait for a mark price update that crosses the stop price
+        
+        Returns:
+            The triggering mark price, or None if cancel() was called
+        """
+        socket_manager = BinanceSocketManager(await self.async_client.get_client())
+        async with socket_manager.symbol_mark_price_socket(symbol, fast=True) as stream:
+            while not self._cancel_event.is_set():
+                msg = await stream.recv()
+                if msg.get('e') == 'error':
+                    raise RuntimeError(f"Mark price stream error: {msg.get('m')}")
+                # Futures symbol streams arrive wrapped as {"stream": ..., "data": {...}}
+                msg = msg.get('data', msg)
+                if 'p' not in msg:
+                    continue
+                
+                mark_price = float(msg['p'])
+                if side == _BUY:
+                    if mark_price >= stop_price:
+                        return mark_price
+                else: # SELL
+                    if mark_price <= stop_price:
+                        return mark_price
+        return None
 
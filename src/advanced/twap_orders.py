@@ -1,7 +1,9 @@
+import asyncio
+import logging
 import time
-from decimal import Decimal
-from datetime import datetime, timedelta
-from ..client import BinanceFuturesClient
+from decimal import Decimal, ROUND_UP
+from datetime import datetime
+from ..client import AsyncBinanceFuturesClient, BinanceFuturesClient, get_shared_client
 from ..validators import OrderValidator
 from ..logger import logger
 
@@ -12,13 +14,50 @@ class TWAPOrder:
     """
     
     def __init__(self, client: BinanceFuturesClient = None):
-        self.client = client or BinanceFuturesClient()
+        self.client = client or get_shared_client()
+        self.async_client = AsyncBinanceFuturesClient(testnet=self.client.testnet)
         self.validator = OrderValidator()
+        self._cancel_event = asyncio.Event()
+        self._orders = []  # Slices filled by the current (or last) run
+    
+    def cancel(self):
+        """
+        Stop a running TWAP before its next slice
+        
+        Call from the event loop running the order; from another thread use
+        loop.call_soon_threadsafe(twap.cancel).
+        """
+        self._cancel_event.set()
+    
+    @staticmethod
+    def _slice_record(order: dict) -> dict:
+        """Summarise a filled slice for the result"""
+        return {
+            "order_id": order['orderId'],
+            "quantity": float(order['origQty']),
+            "price": float(order.get('avgPrice', 0)),
+            "status": order['status']
+        }
     
     def execute(self, symbol: str, side: str, total_quantity: str, 
-                duration_minutes: int, num_slices: int = None):
+                duration_minutes: int, num_slices: int = None, max_burst: int = 4):
+        """Execute a TWAP order (synchronous wrapper around execute_async)"""
+        try:
+            return asyncio.run(self.execute_async(
+                symbol, side, total_quantity, duration_minutes, num_slices, max_burst
+            ))
+        except KeyboardInterrupt:
+            logger.warning("TWAP order interrupted by user after %d slices", len(self._orders))
+            return {
+                "success": False,
+                "error": "Order interrupted",
+                "partial_orders": self._orders
+            }
+    
+    async def execute_async(self, symbol: str, side: str, total_quantity: str, 
+                            duration_minutes: int, num_slices: int = None, max_burst: int = 4):
         """
-        Execute a TWAP order
+        Execute a TWAP order, sleeping between slices without blocking the event loop
         
         Args:
             symbol: Trading symbol (e.g., BTCUSDT)
@@ -26,10 +65,16 @@ class TWAPOrder:
             total_quantity: Total quantity to execute
             duration_minutes: Duration over which to spread the order
             num_slices: Number of slices (defaults to duration_minutes if not specified)
+            max_burst: Most overdue slices submitted together when the schedule slips
         """
         
+        # Fresh per run, before the first await: an asyncio.Event must not outlive the
+        # loop it was first awaited on, and a cancel() issued once the run starts must stick
+        self._cancel_event = asyncio.Event()
+        orders = self._orders = []
+        
         # Validate inputs
-        is_valid, error_msg = self.validator.validate_symbol(symbol)
+        is_valid, error_msg = self.validator.validate_symbol_fast(symbol, self.client.known_symbols)
         if not is_valid:
             return {"success": False, "error": error_msg}
         
@@ -50,130 +95,189 @@ class TWAPOrder:
         if num_slices <= 0:
             return {"success": False, "error": "Number of slices must be positive"}
         
+        if max_burst <= 0:
+            return {"success": False, "error": "Max burst must be positive"}
+        
+        # Loop invariants, computed once per run
+        normalized_side = side.upper()
+        total_qty_f = float(total_qty)
+        
         try:
-            # Get precision
-            qty_precision = self.client.get_quantity_precision(symbol)
+            # Get precision and a single price snapshot (independent lookups, fetched together)
+            qty_precision, current_price = await asyncio.gather(
+                asyncio.to_thread(self.client.get_quantity_precision, symbol),
+                asyncio.to_thread(self.client.get_price, symbol)
+            )
             
             # Calculate slice quantity
-            slice_qty = float(total_qty) / num_slices
+            slice_qty = total_qty_f / num_slices
             slice_qty = round(slice_qty, qty_precision)
             
             # Ensure each slice meets minimum notional
-            current_price = Decimal(str(self.client.get_price(symbol)))
-            current_price_float = float(current_price)
-            min_notional = float(self.validator.MIN_NOTIONAL)
-            min_slice_qty = min_notional / current_price_float
+            min_notional = self.validator.MIN_NOTIONAL_F
+            min_slice_qty = min_notional / current_price
             
             if slice_qty < min_slice_qty:
                 # 1. First try reducing number of slices to increase quantity per slice
-                num_slices = int(float(total_qty) / min_slice_qty)
+                num_slices = int(total_qty_f / min_slice_qty)
                 if num_slices == 0:
                     num_slices = 1
                 
                 # Recalculate slice quantity with new number of slices
-                slice_qty = float(total_qty) / num_slices
+                slice_qty = total_qty_f / num_slices
                 slice_qty = round(slice_qty, qty_precision)
                 
                 # 2. If it's still below minimum (due to rounding or total quantity being too small),
                 # we must round UP to the next valid step size to ensure it passes the $100 check.
                 if slice_qty < min_slice_qty:
-                    step = 10 ** (-qty_precision)
-                    slice_qty = ((min_slice_qty // step) + 1) * step
-                    slice_qty = round(slice_qty, qty_precision)
+                    step = await asyncio.to_thread(self.client.get_quantity_step, symbol)
+                    slice_q = (Decimal(str(min_slice_qty)) / step).quantize(Decimal('1'), rounding=ROUND_UP) * step
+                    slice_qty = float(slice_q)
                     
                     # Recalculate num_slices based on the new larger slice_qty
-                    num_slices = int(float(total_qty) / slice_qty)
+                    num_slices = int(total_qty_f / slice_qty)
                     if num_slices == 0:
                         num_slices = 1
                 
-                logger.info(f"Adjusted to {num_slices} slices of {slice_qty} {symbol} to meet minimum notional per slice")
+                logger.info("Adjusted to %s slices of %s %s to meet minimum notional per slice", num_slices, slice_qty, symbol)
             
             # Calculate interval between slices
             interval_seconds = (duration_minutes * 60) / num_slices
             
             logger.info(
-                f"Executing TWAP {side} order: {total_qty} {symbol} over {duration_minutes} minutes "
-                f"({num_slices} slices, {slice_qty} per slice, {interval_seconds:.1f}s interval)"
+                "Executing TWAP %s order: %s %s over %s minutes (%d slices, %s per slice, %.1fs interval)",
+                side, total_qty, symbol, duration_minutes, num_slices, slice_qty, interval_seconds
             )
             
-            orders = []
-            start_time = datetime.now()
-            end_time = start_time + timedelta(minutes=duration_minutes)
+            # Running totals updated per fill, so nothing rescans orders
+            running_qty = 0.0
+            running_notional = 0.0
             
-            for i in range(num_slices):
+            def record(order: dict):
+                nonlocal running_qty, running_notional
+                entry = self._slice_record(order)
+                orders.append(entry)
+                running_qty += entry['quantity']
+                if entry['price'] > 0:
+                    running_notional += entry['price'] * entry['quantity']
+            
+            # Absolute schedule on the monotonic clock: slice i is due at start + i * interval,
+            # so waits don't accumulate drift and NTP adjustments can't stretch the run
+            start_mono = time.monotonic()
+            end_mono = start_mono + duration_minutes * 60
+            logger.info("TWAP started at %s", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            
+            i = 0
+            while i < num_slices:
+                if self._cancel_event.is_set():
+                    logger.warning("TWAP order cancelled after %d slices", len(orders))
+                    return {
+                        "success": False,
+                        "error": "Order cancelled",
+                        "partial_orders": orders
+                    }
+                
+                # One clock read per slice, shared by the deadline check and the sleep math
+                now = time.monotonic()
+                
                 # Calculate remaining time and adjust if needed
-                current_time = datetime.now()
-                if current_time >= end_time:
+                if now >= end_mono:
                     # Execute remaining quantity as one order
-                    remaining_qty = float(total_qty) - sum(o.get('quantity', 0) for o in orders)
+                    remaining_qty = total_qty_f - running_qty
                     if remaining_qty > 0:
                         remaining_qty = round(remaining_qty, qty_precision)
-                        logger.info(f"Executing final slice: {remaining_qty} {symbol}")
-                        order = self.client.client.futures_create_order(
+                        logger.info("Executing final slice: %s %s", remaining_qty, symbol)
+                        order = await self.async_client.call(
+                            'futures_create_order',
                             symbol=symbol,
-                            side='BUY' if side.upper() == 'BUY' else 'SELL',
+                            side=normalized_side,
                             type='MARKET',
                             quantity=remaining_qty
                         )
-                        orders.append({
-                            "order_id": order['orderId'],
-                            "quantity": float(order['origQty']),
-                            "price": float(order.get('avgPrice', 0)),
-                            "status": order['status']
-                        })
+                        record(order)
                     break
                 
                 # Wait until next slice time (except for first slice)
                 if i > 0:
-                    sleep_time = interval_seconds - (datetime.now() - current_time).total_seconds()
+                    sleep_time = start_mono + i * interval_seconds - now
                     if sleep_time > 0:
-                        logger.info(f"Waiting {sleep_time:.1f}s before next slice...")
-                        time.sleep(sleep_time)
+                        logger.info("Waiting %.1fs before next slice...", sleep_time)
+                        try:
+                            # Sleep until the deadline, waking early if cancel() is called
+                            await asyncio.wait_for(self._cancel_event.wait(), timeout=sleep_time)
+                            continue  # Cancelled; handled at the top of the loop
+                        except asyncio.TimeoutError:
+                            now += sleep_time  # Woke at the deadline
                 
-                # Execute slice
-                logger.info(f"Executing slice {i+1}/{num_slices}: {slice_qty} {symbol}")
-                order = self.client.client.futures_create_order(
-                    symbol=symbol,
-                    side='BUY' if side.upper() == 'BUY' else 'SELL',
-                    type='MARKET',
-                    quantity=slice_qty
-                )
+                # Slices whose deadline has already passed (1 when on schedule), bounded by max_burst
+                slices_due = int((now - start_mono) / interval_seconds) + 1 - i
+                slices_due = max(1, min(slices_due, max_burst, num_slices - i))
                 
-                orders.append({
-                    "order_id": order['orderId'],
-                    "quantity": float(order['origQty']),
-                    "price": float(order.get('avgPrice', 0)),
-                    "status": order['status']
-                })
+                if slices_due >= 2:
+                    # Running late: catch up by submitting the overdue slices concurrently
+                    logger.info("Behind schedule, executing slices %d-%d/%d together", i + 1, i + slices_due, num_slices)
+                    results = await asyncio.gather(*(
+                        self.async_client.call(
+                            'futures_create_order',
+                            symbol=symbol,
+                            side=normalized_side,
+                            type='MARKET',
+                            quantity=slice_qty
+                        )
+                        for _ in range(slices_due)
+                    ), return_exceptions=True)
+                    
+                    failures = [r for r in results if isinstance(r, BaseException)]
+                    for r in results:
+                        if not isinstance(r, BaseException):
+                            record(r)
+                    if failures:
+                        raise failures[0]
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Slices %d-%d executed: Orders %s", i + 1, i + slices_due,
+                                    ', '.join(str(r['orderId']) for r in results))
+                else:
+                    # Execute slice
+                    logger.info("Executing slice %d/%d: %s %s", i + 1, num_slices, slice_qty, symbol)
+                    order = await self.async_client.call(
+                        'futures_create_order',
+                        symbol=symbol,
+                        side=normalized_side,
+                        type='MARKET',
+                        quantity=slice_qty
+                    )
+                    
+                    record(order)
+                    
+                    logger.info("Slice %d executed: Order %s", i + 1, order['orderId'])
                 
-                logger.info(f"Slice {i+1} executed: Order {order['orderId']}")
+                i += slices_due
             
-            total_executed = sum(o['quantity'] for o in orders)
-            avg_price = sum(o['price'] * o['quantity'] for o in orders if o['price'] > 0) / total_executed if total_executed > 0 else 0
+            total_executed = running_qty
+            avg_price = running_notional / total_executed if total_executed > 0 else 0
             
             logger.info(
-                f"TWAP order completed: {len(orders)} slices, "
-                f"total: {total_executed}, avg price: ${avg_price:.2f}"
+                "TWAP order completed: %d slices, total: %s, avg price: $%.2f",
+                len(orders), total_executed, avg_price
             )
             
             return {
                 "success": True,
                 "symbol": symbol,
-                "side": side.upper(),
-                "total_quantity": float(total_qty),
+                "side": normalized_side,
+                "total_quantity": total_qty_f,
                 "executed_quantity": total_executed,
                 "average_price": avg_price,
                 "num_slices": len(orders),
                 "orders": orders
             }
             
-        except KeyboardInterrupt:
-            logger.warning("TWAP order interrupted by user")
-            return {
-                "success": False,
-                "error": "Order interrupted",
-                "partial_orders": orders if 'orders' in locals() else []
-            }
+        except asyncio.CancelledError:
+            # Propagate so the caller's cancellation completes; execute() reports partial fills
+            logger.warning("TWAP order cancelled after %d slices: %s", len(orders), orders)
+            raise
         except Exception as e:
-            logger.error(f"TWAP order failed: {e}")
-            return {"success": False, "error": str(e)}
+            logger.error("TWAP order failed: %s", e)
+            return {"success": False, "error": str(e), "partial_orders": orders}
+        finally:
+            await self.async_client.close()
@@ -1,12 +1,52 @@
 import argparse
+import importlib
 import sys
-from .market_orders import MarketOrder
-from .limit_orders import LimitOrder
-from .advanced.stop_limit_orders import StopLimitOrder
-from .advanced.oco_orders import OCOOrder
-from .advanced.twap_orders import TWAPOrder
-from .advanced.grid_orders import GridOrder
-from .logger import logger
+
+# Command name -> (bot module, bot class, builder turning parsed args into execute() keyword arguments)
+# Modules are imported only for the command being run, so one invocation doesn't load the
+# Binance client and every other bot just to parse arguments
+COMMANDS = {
+    'market': ('.market_orders', 'MarketOrder', lambda a: dict(
+        symbol=a.symbol.upper(),
+        side=a.side.upper(),
+        quantity=a.quantity
+    )),
+    'limit': ('.limit_orders', 'LimitOrder', lambda a: dict(
+        symbol=a.symbol.upper(),
+        side=a.side.upper(),
+        quantity=a.quantity,
+        price=a.price
+    )),
+    'stop-limit': ('.advanced.stop_limit_orders', 'StopLimitOrder', lambda a: dict(
+        symbol=a.symbol.upper(),
+        side=a.side.upper(),
+        quantity=a.quantity,
+        limit_price=a.limit_price,
+        stop_price=a.stop_price
+    )),
+    'oco': ('.advanced.oco_orders', 'OCOOrder', lambda a: dict(
+        symbol=a.symbol.upper(),
+        side=a.side.upper(),
+        quantity=a.quantity,
+        take_profit_price=a.take_profit,
+        stop_loss_price=a.stop_loss
+    )),
+    'twap': ('.advanced.twap_orders', 'TWAPOrder', lambda a: dict(
+        symbol=a.symbol.upper(),
+        side=a.side.upper(),
+        total_quantity=a.quantity,
+        duration_minutes=a.duration,
+        num_slices=a.slices,
+        max_burst=a.max_burst
+    )),
+    'grid': ('.advanced.grid_orders', 'GridOrder', lambda a: dict(
+        symbol=a.symbol.upper(),
+        lower_price=a.lower_price,
+        upper_price=a.upper_price,
+        grid_levels=a.levels,
+        quantity_per_level=a.quantity
+    )),
+}
 
 def main():
     parser = argparse.ArgumentParser(description="Binance Futures Trading Bot")
@@ -48,6 +88,7 @@ def main():
     twap_parser.add_argument('quantity', help='Total order quantity')
     twap_parser.add_argument('duration', type=int, help='Duration in minutes')
     twap_parser.add_argument('--slices', type=int, help='Number of slices (defaults to duration_minutes)')
+    twap_parser.add_argument('--max-burst', type=int, default=4, help='Most overdue slices to submit at once when behind schedule (default: 4)')
     
     # Grid order command
     grid_parser = subparsers.add_parser('grid', help='Place grid order (automated buy-low/sell-high within price range)')
@@ -59,69 +100,18 @@ def main():
     
     args = parser.parse_args()
     
-    result = None
-    
-    if args.command == 'market':
-        bot = MarketOrder()
-        result = bot.execute(
-            symbol=args.symbol.upper(),
-            side=args.side.upper(),
-            quantity=args.quantity
-        )
-        
-    elif args.command == 'limit':
-        bot = LimitOrder()
-        result = bot.execute(
-            symbol=args.symbol.upper(),
-            side=args.side.upper(),
-            quantity=args.quantity,
-            price=args.price
-        )
-        
-    elif args.command == 'stop-limit':
-        bot = StopLimitOrder()
-        result = bot.execute(
-            symbol=args.symbol.upper(),
-            side=args.side.upper(),
-            quantity=args.quantity,
-            limit_price=args.limit_price,
-            stop_price=args.stop_price
-        )
-        
-    elif args.command == 'oco':
-        bot = OCOOrder()
-        result = bot.execute(
-            symbol=args.symbol.upper(),
-            side=args.side.upper(),
-            quantity=args.quantity,
-            take_profit_price=args.take_profit,
-            stop_loss_price=args.stop_loss
-        )
-        
-    elif args.command == 'twap':
-        bot = TWAPOrder()
-        result = bot.execute(
-            symbol=args.symbol.upper(),
-            side=args.side.upper(),
-            total_quantity=args.quantity,
-            duration_minutes=args.duration,
-            num_slices=args.slices
-        )
-        
-    elif args.command == 'grid':
-        bot = GridOrder()
-        result = bot.execute(
-            symbol=args.symbol.upper(),
-            lower_price=args.lower_price,
-            upper_price=args.upper_price,
-            grid_levels=args.levels,
-            quantity_per_level=args.quantity
-        )
-        
-    else:
+    if args.command not in COMMANDS:
         parser.print_help()
         sys.exit(1)
     
+    module_name, class_name, build_kwargs = COMMANDS[args.command]
+    bot_class = getattr(importlib.import_module(module_name, __package__), class_name)
+    from .client import get_shared_client
+    
+    # One client (HTTPS session, caches, rate limiter) shared by whichever bot runs
+    bot = bot_class(client=get_shared_client())
+    result = bot.execute(**build_kwargs(args))
+    
     # Display results based on order type
     if result and result.get("success"):
         print(f"✅ Order successful!")
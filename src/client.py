@@ -1,19 +1,106 @@
+import asyncio
+import random
+import threading
+import time
+from decimal import Decimal
+import aiohttp  # pyright: ignore[reportMissingImports]
+from binance import AsyncClient  # pyright: ignore[reportMissingImports]
 from binance.client import Client  # pyright: ignore[reportMissingImports]
 from binance.exceptions import BinanceAPIException  # pyright: ignore[reportMissingImports]
+from requests.adapters import HTTPAdapter  # pyright: ignore[reportMissingImports]
 from .config import settings
 from .logger import logger
 
+class RateLimiter:
+    """Thread-safe token bucket used to pace order submissions"""
+    
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens if available, otherwise return the seconds to wait for them"""
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+    
+    def acquire(self, tokens: float = 1):
+        """Block until the requested number of tokens is available"""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, tokens: float = 1):
+        """Wait without blocking the event loop until the tokens are available"""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+# Responses that guarantee the request was rejected before execution, so it is safe to resend
+RETRYABLE_STATUS_CODES = (418, 429)  # IP auto-banned / rate limited
+RETRYABLE_ERROR_CODES = (-1003, -1015)  # Too many requests / too many new orders
+UNKNOWN_STATUS_ERROR_CODES = (-1007,)  # Timeout waiting for the backend; execution status unknown
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed request can be resent without risking a duplicate order"""
+    if isinstance(error, BinanceAPIException):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.code in RETRYABLE_ERROR_CODES
+    # The connection was never established, so nothing reached the exchange
+    return isinstance(error, aiohttp.ClientConnectorError)
+
+def is_definite_rejection(error: Exception) -> bool:
+    """Whether a failed order request is known not to have created any order"""
+    if _is_retryable(error):
+        return True
+    # 4xx responses are refusals, except the timeout code whose outcome is unknown
+    return (isinstance(error, BinanceAPIException) and error.status_code < 500
+            and error.code not in UNKNOWN_STATUS_ERROR_CODES)
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds requested by a Retry-After header, if the error carries one"""
+    response = getattr(error, 'response', None)
+    value = response.headers.get('Retry-After') if response is not None else None
+    return float(value) if value else None
+
+def _api_credentials() -> tuple[str, str]:
+    """Return the configured API key and secret, raising if either is missing"""
+    if not settings.BINANCE_API_KEY or not settings.BINANCE_API_KEY.strip():
+        raise ValueError("BINANCE_API_KEY is not set in .env file")
+    if not settings.BINANCE_API_SECRET or not settings.BINANCE_API_SECRET.strip():
+        raise ValueError("BINANCE_API_SECRET is not set in .env file")
+    return settings.BINANCE_API_KEY.strip(), settings.BINANCE_API_SECRET.strip()
+
+def _decimal_places(step: float, default: int) -> int:
+    """Number of decimal places implied by a step/tick size (e.g., 0.001 -> 3)"""
+    if step == 0:
+        return default
+    exponent = Decimal(str(step)).normalize().as_tuple().exponent
+    return -exponent if exponent < 0 else 0
+
 class BinanceFuturesClient:
     """Wrapper for Binance Futures API with error handling"""
     
+    ORDER_RATE_LIMIT = 9  # Orders per second, kept under Binance's 10/s cap
+    HTTP_POOL_CONNECTIONS = 20  # Distinct hosts kept in the pool
+    HTTP_POOL_SIZE = 50
+    PRECISION_CACHE_TTL = 300  # Seconds; exchange filters change rarely
+    EXCHANGE_INFO_CACHE_TTL = 300  # Seconds; the full exchangeInfo payload is large and rarely changes
+    PRICE_CACHE_TTL = 0.5  # Seconds; coalesces repeated lookups within one execution
+    STALE_FILTER_CODES = (-1111, -1013, -4014, -4164)  # Rejections that suggest exchangeInfo changed
+    
     def __init__(self, testnet: bool = None):
         testnet = testnet if testnet is not None else settings.FUTURES_TESTNET
+        self.testnet = testnet
         
         # Validate API credentials
-        if not settings.BINANCE_API_KEY or not settings.BINANCE_API_KEY.strip():
-            raise ValueError("BINANCE_API_KEY is not set in .env file")
-        if not settings.BINANCE_API_SECRET or not settings.BINANCE_API_SECRET.strip():
-            raise ValueError("BINANCE_API_SECRET is not set in .env file")
+        api_key, api_secret = _api_credentials()
         
         if testnet:
             self.base_url = 'https://testnet.binancefuture.com'
@@ -23,26 +110,110 @@ class BinanceFuturesClient:
             logger.info("Connecting to Binance FUTURES LIVE")
         
         self.client = Client(
-            api_key=settings.BINANCE_API_KEY.strip(),
-            api_secret=settings.BINANCE_API_SECRET.strip(),
+            api_key=api_key,
+            api_secret=api_secret,
             testnet=testnet
         )
+        
+        # Larger connection pool so concurrent order submissions don't queue on a single socket
+        self.client.session.mount('https://', HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            pool_block=False
+        ))
+        self.order_limiter = RateLimiter(self.ORDER_RATE_LIMIT)
+        
+        self._precision_cache = {}  # symbol -> (fetched_at, precision tuple)
+        self._price_cache = {}  # symbol -> (fetched_at, raw price string)
+        self._symbol_index = None  # (fetched_at, {symbol: parsed symbol info})
+    
+    def _get_symbol_index(self) -> dict:
+        """
+        Parsed symbol info keyed by symbol
+        
+        Built in one pass over futures exchangeInfo and reused for
+        EXCHANGE_INFO_CACHE_TTL seconds, so per-order lookups are a dict hit.
+        """
+        cached = self._symbol_index
+        if cached and time.monotonic() - cached[0] < self.EXCHANGE_INFO_CACHE_TTL:
+            return cached[1]
+        
+        exchange_info = self.client.futures_exchange_info()
+        index = {s['symbol']: self._parse_symbol(s) for s in exchange_info['symbols']}
+        self._symbol_index = (time.monotonic(), index)
+        return index
+    
+    @staticmethod
+    def _parse_symbol(s: dict) -> dict:
+        """Extract status and the precision-relevant filters from an exchangeInfo symbol entry"""
+        filters = {}
+        quantity_step = price_step = None
+        for f in s.get('filters', []):
+            filter_type = f.get('filterType')
+            if filter_type == 'LOT_SIZE':
+                filters['quantity'] = {
+                    'minQty': float(f.get('minQty', 0)),
+                    'maxQty': float(f.get('maxQty', 0)),
+                    'stepSize': float(f.get('stepSize', 0))
+                }
+                quantity_step = Decimal(f.get('stepSize', '0')).normalize()
+            elif filter_type == 'PRICE_FILTER':
+                filters['price'] = {
+                    'minPrice': float(f.get('minPrice', 0)),
+                    'maxPrice': float(f.get('maxPrice', 0)),
+                    'tickSize': float(f.get('tickSize', 0))
+                }
+                price_step = Decimal(f.get('tickSize', '0')).normalize()
+            elif filter_type == 'MIN_NOTIONAL':
+                filters['notional'] = {
+                    'minNotional': float(f.get('notional', 0))
+                }
+        return {
+            'symbol': s['symbol'],
+            'status': s['status'],
+            'filters': filters,
+            # Exact LOT_SIZE / PRICE_FILTER steps as reported
+            'quantity_step': quantity_step,
+            'price_step': price_step
+        }
+    
+    @property
+    def known_symbols(self):
+        """
+        Symbols listed in the cached exchangeInfo, or an empty set if it hasn't been fetched yet
+        
+        Never triggers a request, so it is safe to consult on the event loop.
+        """
+        cached = self._symbol_index
+        return cached[1].keys() if cached else frozenset()
     
     def validate_symbol(self, symbol: str) -> bool:
         """Validate if symbol exists on Binance Futures"""
         try:
-            exchange_info = self.client.futures_exchange_info()
-            symbols = [s['symbol'] for s in exchange_info['symbols']]
-            return symbol.upper() in symbols
+            return symbol.upper() in self._get_symbol_index()
         except BinanceAPIException as e:
             logger.error(f"Symbol validation failed: {e}")
             return False
     
     def get_price(self, symbol: str) -> float:
-        """Get current price for a symbol"""
+        """Get current price for a symbol (cached for PRICE_CACHE_TTL seconds)"""
+        return float(self.get_price_raw(symbol))
+    
+    def get_price_raw(self, symbol: str) -> str:
+        """
+        Get current price exactly as the API returned it (e.g. "50123.45")
+        
+        Suitable for Decimal(...) without a float round-trip. Shares the
+        PRICE_CACHE_TTL cache with get_price.
+        """
+        cached = self._price_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self.PRICE_CACHE_TTL:
+            return cached[1]
+        
         try:
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            return float(ticker['price'])
+            price = self.client.futures_symbol_ticker(symbol=symbol)['price']
+            self._price_cache[symbol] = (time.monotonic(), price)
+            return price
         except BinanceAPIException as e:
             logger.error(f"Failed to get price for {symbol}: {e}")
             raise
@@ -50,66 +221,189 @@ class BinanceFuturesClient:
     def get_symbol_info(self, symbol: str) -> dict:
         """Get symbol information including precision filters"""
         try:
-            exchange_info = self.client.futures_exchange_info()
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol.upper():
-                    filters = {}
-                    for f in s.get('filters', []):
-                        filter_type = f.get('filterType')
-                        if filter_type == 'LOT_SIZE':
-                            filters['quantity'] = {
-                                'minQty': float(f.get('minQty', 0)),
-                                'maxQty': float(f.get('maxQty', 0)),
-                                'stepSize': float(f.get('stepSize', 0))
-                            }
-                        elif filter_type == 'PRICE_FILTER':
-                            filters['price'] = {
-                                'minPrice': float(f.get('minPrice', 0)),
-                                'maxPrice': float(f.get('maxPrice', 0)),
-                                'tickSize': float(f.get('tickSize', 0))
-                            }
-                        elif filter_type == 'MIN_NOTIONAL':
-                            filters['notional'] = {
-                                'minNotional': float(f.get('notional', 0))
-                            }
-                    return {
-                        'symbol': s['symbol'],
-                        'status': s['status'],
-                        'filters': filters
-                    }
-            raise ValueError(f"Symbol {symbol} not found")
+            info = self._get_symbol_index().get(symbol.upper())
+            if info is None:
+                raise ValueError(f"Symbol {symbol} not found")
+            return info
         except BinanceAPIException as e:
             logger.error(f"Failed to get symbol info for {symbol}: {e}")
             raise
     
-    def get_quantity_precision(self, symbol: str) -> int:
-        """Get the number of decimal places allowed for quantity"""
+    def get_quantity_step(self, symbol: str) -> Decimal:
+        """
+        Get the LOT_SIZE step size exactly as the exchange reports it
+        
+        Falls back to one unit of the quantity precision if the filter can't be read.
+        """
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            step_size = symbol_info['filters'].get('quantity', {}).get('stepSize', 0)
-            if step_size == 0:
-                return 8  # Default to 8 decimal places
-            # Calculate precision from step size (e.g., 0.001 -> 3 decimals)
-            step_str = f"{step_size:.10f}".rstrip('0')
-            if '.' in step_str:
-                return len(step_str.split('.')[1])
-            return 0
+            step = self.get_symbol_info(symbol)['quantity_step']
+            if step:
+                return step
         except Exception as e:
-            logger.warning(f"Could not determine quantity precision for {symbol}, using default: {e}")
-            return 8
+            logger.warning(f"Could not read step size for {symbol}, deriving it from precision: {e}")
+        return Decimal(1).scaleb(-self.get_quantity_precision(symbol))
+    
+    def get_price_step(self, symbol: str) -> Decimal:
+        """
+        Get the PRICE_FILTER tick size exactly as the exchange reports it
+        
+        Falls back to one unit of the price precision if the filter can't be read.
+        """
+        try:
+            step = self.get_symbol_info(symbol)['price_step']
+            if step:
+                return step
+        except Exception as e:
+            logger.warning(f"Could not read tick size for {symbol}, deriving it from precision: {e}")
+        return Decimal(1).scaleb(-self.get_price_precision(symbol))
+    
+    def get_quantity_precision(self, symbol: str) -> int:
+        """Get the number of decimal places allowed for quantity (cached, default 8)"""
+        return self.get_symbol_precision(symbol)[1]
     
     def get_price_precision(self, symbol: str) -> int:
-        """Get the number of decimal places allowed for price"""
+        """Get the number of decimal places allowed for price (cached, default 2)"""
+        return self.get_symbol_precision(symbol)[0]
+    
+    def get_symbol_precision(self, symbol: str) -> tuple[int, int, float, float]:
+        """
+        Get price/quantity precision and filters from a single exchangeInfo lookup
+        
+        Results are cached per symbol for PRECISION_CACHE_TTL seconds.
+        
+        Returns:
+            (price_precision, quantity_precision, min_notional, tick_size)
+        """
+        symbol = symbol.upper()
+        cached = self._precision_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self.PRECISION_CACHE_TTL:
+            return cached[1]
+        
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            tick_size = symbol_info['filters'].get('price', {}).get('tickSize', 0)
-            if tick_size == 0:
-                return 2  # Default to 2 decimal places
-            # Calculate precision from tick size (e.g., 0.01 -> 2 decimals)
-            tick_str = f"{tick_size:.10f}".rstrip('0')
-            if '.' in tick_str:
-                return len(tick_str.split('.')[1])
-            return 0
+            filters = self.get_symbol_info(symbol)['filters']
         except Exception as e:
-            logger.warning(f"Could not determine price precision for {symbol}, using default: {e}")
-            return 2
\ No newline at end of file
+            logger.warning(f"Could not determine precision for {symbol}, using defaults: {e}")
+            return 2, 8, 0.0, 0.0
+        
+        tick_size = filters.get('price', {}).get('tickSize', 0)
+        step_size = filters.get('quantity', {}).get('stepSize', 0)
+        precision = (
+            _decimal_places(tick_size, default=2),
+            _decimal_places(step_size, default=8),
+            filters.get('notional', {}).get('minNotional', 0.0),
+            tick_size
+        )
+        self._precision_cache[symbol] = (time.monotonic(), precision)
+        return precision
+    
+    def invalidate_symbol(self, symbol: str, error: Exception = None):
+        """
+        Drop cached exchange metadata for a symbol
+        
+        Args:
+            symbol: Trading symbol
+            error: Optional order error; the cache is only dropped if its code
+                   points at stale precision or filters
+        """
+        if error is not None and getattr(error, 'code', None) not in self.STALE_FILTER_CODES:
+            return
+        self._precision_cache.pop(symbol.upper(), None)
+        # Force the next lookup to refetch filters rather than rebuild them from the same payload
+        self._symbol_index = None
+
+_shared_clients = {}  # testnet flag -> BinanceFuturesClient
+_shared_client_lock = threading.Lock()
+
+def get_shared_client(testnet: bool = None) -> BinanceFuturesClient:
+    """
+    Return the process-wide BinanceFuturesClient for testnet or live, creating it on first use
+    
+    Sharing one client keeps a single pooled HTTPS session (no repeated TLS
+    handshakes), one order rate limiter and one set of metadata caches.
+    """
+    if testnet is None:
+        testnet = settings.FUTURES_TESTNET
+    client = _shared_clients.get(testnet)
+    if client is None:
+        with _shared_client_lock:
+            client = _shared_clients.get(testnet)
+            if client is None:
+                client = _shared_clients[testnet] = BinanceFuturesClient(testnet=testnet)
+    return client
+
+class AsyncBinanceFuturesClient:
+    """
+    Lazily constructed python-binance AsyncClient for streaming and async work
+    
+    The underlying aiohttp session is bound to the event loop it was created
+    in, so call close() before that loop finishes.
+    """
+    
+    CONNECTION_LIMIT = 32
+    DNS_CACHE_TTL = 300  # Seconds
+    USED_WEIGHT_LIMIT = 2400  # Request weight per minute
+    ORDER_COUNT_LIMIT = 1200  # Orders per minute
+    LIMIT_HEADROOM = 0.9  # Pause once this fraction of either budget is used
+    
+    def __init__(self, testnet: bool = None):
+        self.testnet = testnet if testnet is not None else settings.FUTURES_TESTNET
+        self._client = None
+    
+    async def get_client(self) -> AsyncClient:
+        """Create the AsyncClient on first use and return it"""
+        if self._client is None:
+            api_key, api_secret = _api_credentials()
+            # One pooled session shared by every request made through this client
+            connector = aiohttp.TCPConnector(limit=self.CONNECTION_LIMIT, ttl_dns_cache=self.DNS_CACHE_TTL)
+            self._client = await AsyncClient.create(
+                api_key=api_key,
+                api_secret=api_secret,
+                testnet=self.testnet,
+                session_params={'connector': connector}
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._client is not None:
+            await self._client.close_connection()
+            self._client = None
+    
+    async def call(self, method: str, attempts: int = 4, initial_wait: float = 0.2,
+                   max_wait: float = 5.0, **params):
+        """
+        Call an AsyncClient method, retrying rate-limit rejections with
+        exponential backoff and jitter
+        
+        Only errors that guarantee the request was not executed are retried
+        (see _is_retryable); anything else is raised immediately.
+        """
+        client = await self.get_client()
+        for attempt in range(attempts):
+            try:
+                result = await getattr(client, method)(**params)
+            except (BinanceAPIException, aiohttp.ClientError) as e:
+                if attempt == attempts - 1 or not _is_retryable(e):
+                    raise
+                wait = _retry_after(e) or min(max_wait, initial_wait * 2 ** attempt) + random.uniform(0, initial_wait)
+                logger.warning(f"{method} rejected ({e}), retrying in {wait:.2f}s")
+                await asyncio.sleep(wait)
+                continue
+            
+            await self._respect_usage_headers()
+            return result
+    
+    async def _respect_usage_headers(self):
+        """Pause until the next minute window when the last response shows the limits are nearly used up"""
+        headers = getattr(getattr(self._client, 'response', None), 'headers', None) or {}
+        used_weight = int(headers.get('X-MBX-USED-WEIGHT-1M', 0))
+        order_count = int(headers.get('X-MBX-ORDER-COUNT-1M', 0))
+        
+        if (used_weight >= self.USED_WEIGHT_LIMIT * self.LIMIT_HEADROOM
+                or order_count >= self.ORDER_COUNT_LIMIT * self.LIMIT_HEADROOM):
+            wait = 60 - time.time() % 60
+            logger.warning(
+                f"Approaching Binance rate limits (weight {used_weight}, orders {order_count}), "
+                f"pausing {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
@@ -1,7 +1,12 @@
+import os
 from dotenv import load_dotenv  # pyright: ignore[reportMissingImports]
 from pydantic_settings import BaseSettings, SettingsConfigDict  # pyright: ignore[reportMissingImports]
 
-load_dotenv()
+# Skip reading .env when the credentials are already exported (CI, containers, systemd units);
+# both load_dotenv and pydantic-settings' own env_file parsing are skipped in that case
+_ENV_POPULATED = bool(os.getenv('BINANCE_API_KEY') and os.getenv('BINANCE_API_SECRET'))
+if not _ENV_POPULATED:
+    load_dotenv()
 
 class Settings(BaseSettings):
     # Binance API credentials
@@ -10,17 +15,12 @@ class Settings(BaseSettings):
     
     # Trading parameters
     FUTURES_TESTNET: bool = True  # Start with testnet!
+    OCO_SIMULATED_FALLBACK: bool = True  # Watch the SL client-side if the exchange rejects every native SL
     
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=None if _ENV_POPULATED else ".env",
         env_file_encoding="utf-8",
         case_sensitive=False
     )
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Convert FUTURES_TESTNET string to bool if needed
-        if isinstance(self.FUTURES_TESTNET, str):
-            self.FUTURES_TESTNET = self.FUTURES_TESTNET.lower() in ("true", "1", "yes", "on")
 
 settings = Settings()   
\ No newline at end of file
@@ -1,5 +1,6 @@
-from decimal import Decimal
-from .client import BinanceFuturesClient
+import logging
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN, ROUND_UP
+from .client import BinanceFuturesClient, get_shared_client
 from .validators import OrderValidator
 from .logger import logger, log_order_action
 
@@ -7,7 +8,7 @@ class LimitOrder:
     """Handle limit orders"""
     
     def __init__(self, client: BinanceFuturesClient = None):
-        self.client = client or BinanceFuturesClient()
+        self.client = client or get_shared_client()
         self.validator = OrderValidator()
     
     def execute(self, symbol: str, side: str, quantity: str, price: str):
@@ -15,10 +16,10 @@ class LimitOrder:
         
         log_order_action(logger, 'ORDER_INITIATED',
                         symbol=symbol, side=side.upper(), quantity=quantity, price=price,
-                        order_type='LIMIT', message=f"Limit {side} order initiated")
+                        order_type='LIMIT', message="Limit %s order initiated", args=(side,))
         
         # Validate inputs
-        is_valid, error_msg = self.validator.validate_symbol(symbol)
+        is_valid, error_msg = self.validator.validate_symbol_fast(symbol, self.client.known_symbols)
         if not is_valid:
             log_order_action(logger, 'VALIDATION_FAILED',
                            symbol=symbol, error_code='INVALID_SYMBOL', message=error_msg)
@@ -44,55 +45,52 @@ class LimitOrder:
         
         try:
             # Get current price for validation
-            current_price = Decimal(str(self.client.get_price(symbol)))
+            current_price = Decimal(self.client.get_price_raw(symbol))
             
-            # Get precision first, then round before validation
-            qty_precision = self.client.get_quantity_precision(symbol)
-            price_precision = self.client.get_price_precision(symbol)
+            # Get step sizes first, then round before validation (exact Decimal throughout)
+            qty_step = self.client.get_quantity_step(symbol)
+            price_step = self.client.get_price_step(symbol)
             
-            # Round price to correct precision
-            price_rounded = round(float(price_dec), price_precision)
+            # Round price to the nearest tick
+            price_rounded_dec = (price_dec / price_step).quantize(Decimal('1'), rounding=ROUND_HALF_EVEN) * price_step
             
-            # Round quantity to correct precision
-            qty_rounded = round(float(qty), qty_precision)
+            # Round quantity down to a whole number of steps
+            qty_rounded_dec = (qty / qty_step).quantize(Decimal('1'), rounding=ROUND_DOWN) * qty_step
             
             # If rounded quantity doesn't meet minimum notional, round up to next step
-            min_notional = float(self.validator.MIN_NOTIONAL)
-            if qty_rounded * price_rounded < min_notional:
+            if price_rounded_dec > 0 and qty_rounded_dec * price_rounded_dec < self.validator.MIN_NOTIONAL:
                 # Calculate minimum quantity needed
-                min_qty_needed = min_notional / price_rounded
-                # Round up to next valid step
-                step = 10 ** (-qty_precision)
-                qty_rounded = ((min_qty_needed // step) + 1) * step
-                qty_rounded = round(qty_rounded, qty_precision)
-                logger.info(f"Adjusted quantity to {qty_rounded} to meet minimum notional requirement")
+                min_qty_needed = self.validator.MIN_NOTIONAL / price_rounded_dec
+                qty_rounded_dec = (min_qty_needed / qty_step).quantize(Decimal('1'), rounding=ROUND_UP) * qty_step
+                logger.info("Adjusted quantity to %s to meet minimum notional requirement", qty_rounded_dec)
             
             # Validate minimum notional value ($100) with rounded values
-            qty_rounded_dec = Decimal(str(qty_rounded))
-            price_rounded_dec = Decimal(str(price_rounded))
             is_valid, error_msg = self.validator.validate_notional(qty_rounded_dec, price_rounded_dec)
             if not is_valid:
-                logger.error(f"Order validation failed: {error_msg}")
+                logger.error("Order validation failed: %s", error_msg)
                 return {"success": False, "error": error_msg}
             
             # Validate limit price is reasonable
             is_valid, error_msg = self.validator.validate_limit_price(price_rounded_dec, current_price, side)
             if not is_valid:
-                logger.error(f"Price validation failed: {error_msg}")
+                logger.error("Price validation failed: %s", error_msg)
                 return {"success": False, "error": error_msg}
             
-            log_order_action(logger, 'ORDER_PLACING',
-                           symbol=symbol, side=side.upper(), quantity=qty_rounded, price=price_rounded,
-                           current_price=f"${current_price}", value=f"${qty_rounded * price_rounded:.2f}",
-                           message=f"Placing LIMIT {side} order")
+            # Only build the formatted fields if the record will be emitted
+            if logger.isEnabledFor(logging.INFO):
+                log_order_action(logger, 'ORDER_PLACING',
+                               symbol=symbol, side=side.upper(), quantity=qty_rounded_dec, price=price_rounded_dec,
+                               current_price=f"${current_price}", value=f"${qty_rounded_dec * price_rounded_dec:.2f}",
+                               message="Placing LIMIT %s order", args=(side,))
             
             order = self.client.client.futures_create_order(
                 symbol=symbol,
                 side='BUY' if side.upper() == 'BUY' else 'SELL',
                 type='LIMIT',
                 timeInForce='GTC',  # Good Till Canceled
-                quantity=qty_rounded,
-                price=price_rounded
+                # Plain decimal strings avoid float serialisation artefacts in the payload
+                quantity=format(qty_rounded_dec, 'f'),
+                price=format(price_rounded_dec, 'f')
             )
             
             log_order_action(logger, 'ORDER_PLACED',
@@ -114,5 +112,5 @@ class LimitOrder:
             error_str = str(e)
             log_order_action(logger, 'ORDER_FAILED',
                            symbol=symbol, side=side.upper(), error_code='EXECUTION_ERROR',
-                           message=f"Limit order failed: {error_str}")
+                           message="Limit order failed: %s", args=(error_str,))
             return {"success": False, "error": error_str}
\ No newline at end of file
@@ -1,70 +1,118 @@
+import atexit
 import logging
+import queue
 import sys
 import json
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# Per-thread cache of the formatted whole-second part of the last timestamp
+_ts_cache = threading.local()
+
+def _format_timestamp(created: float) -> str:
+    """ISO-8601 local timestamp with microseconds, reusing the seconds prefix within the same second"""
+    sec = int(created)
+    if getattr(_ts_cache, 'last_sec', None) != sec:
+        _ts_cache.last_sec = sec
+        _ts_cache.prefix = datetime.fromtimestamp(sec).isoformat(timespec='seconds')
+    return f"{_ts_cache.prefix}.{int((created - sec) * 1e6):06d}"
+
+# Structured extras rendered by StructuredFormatter, in output order: (record attribute, "LABEL=" prefix)
+_FIELDS = (
+    ('action', 'ACTION='),
+    ('symbol', 'SYMBOL='),
+    ('order_id', 'ORDER_ID='),
+    ('side', 'SIDE='),
+    ('quantity', 'QTY='),
+    ('price', 'PRICE='),
+    ('error_code', 'ERROR_CODE='),
+)
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON-like format"""
-        log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-        }
-        
-        # Add extra fields if present
-        if hasattr(record, 'action'):
-            log_data['action'] = record.action
-        if hasattr(record, 'order_id'):
-            log_data['order_id'] = record.order_id
-        if hasattr(record, 'symbol'):
-            log_data['symbol'] = record.symbol
-        if hasattr(record, 'side'):
-            log_data['side'] = record.side
-        if hasattr(record, 'quantity'):
-            log_data['quantity'] = record.quantity
-        if hasattr(record, 'price'):
-            log_data['price'] = record.price
-        if hasattr(record, 'error_code'):
-            log_data['error_code'] = record.error_code
-        
-        # Format as readable structured log
-        parts = [f"[{log_data['timestamp']}]", f"{log_data['level']}"]
-        
-        if 'action' in log_data:
-            parts.append(f"ACTION={log_data['action']}")
-        
-        if 'symbol' in log_data:
-            parts.append(f"SYMBOL={log_data['symbol']}")
-        
-        if 'order_id' in log_data:
-            parts.append(f"ORDER_ID={log_data['order_id']}")
-        
-        if 'side' in log_data:
-            parts.append(f"SIDE={log_data['side']}")
-        
-        if 'quantity' in log_data:
-            parts.append(f"QTY={log_data['quantity']}")
+        # Extras are plain instance attributes, so one dict probe per field replaces hasattr
+        d = record.__dict__
+        parts = [f"[{_format_timestamp(record.created)}]", record.levelname]
+        parts += [prefix + str(d[attr]) for attr, prefix in _FIELDS if attr in d]
+        parts.append("MSG=" + record.getMessage())
         
-        if 'price' in log_data:
-            parts.append(f"PRICE={log_data['price']}")
-        
-        if 'error_code' in log_data:
-            parts.append(f"ERROR_CODE={log_data['error_code']}")
-        
-        parts.append(f"MSG={log_data['message']}")
+        if 'events' in d:
+            parts.append(f"EVENTS={json.dumps(d['events'], default=str)}")
         
         return " | ".join(parts)
 
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records stay in-process, so they need no pickling-safe copy
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        # Block rather than drop when the bounded queue is full; order logs are an audit trail
+        self.queue.put(record)
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler writing through a large buffer instead of flushing every record
+    
+    Records are written by the listener thread, so buffered lines reach disk in
+    batches; ERROR and above are flushed immediately, and the rest as soon as
+    the listener's queue runs dry (see DrainFlushQueueListener).
+    """
+    
+    BUFFER_SIZE = 65536
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+class DrainFlushQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers whenever the queue is empty
+    
+    Bursts of records are written in buffered batches, but once the backlog
+    is handled everything is on disk, so a hard kill (SIGKILL, a crash before
+    atexit) loses at most the records still queued, not an idle buffer.
+    """
+    
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+LOG_QUEUE_SIZE = 10000  # Records buffered for the listener before callers wait
+
+# Active queue listeners by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+# Configured loggers by (name, log level, date); a new day gets a new log file
+_LOGGER_CACHE: Dict[tuple, logging.Logger] = {}
+
 def setup_logger(name: str = "binance_bot", log_level: int = logging.INFO):
     """
     Setup structured logging with file and console output
     
+    Records are queued by the calling thread and formatted and written by a
+    background QueueListener, keeping file and console I/O off the order path.
+    
     Args:
         name: Logger name
         log_level: Logging level (default: INFO)
@@ -73,12 +121,18 @@ def setup_logger(name: str = "binance_bot", log_level: int = logging.INFO):
         Configured logger instance
     """
     
+    # Repeat calls on the same day reuse the configured logger instead of rebuilding handlers
+    today = datetime.now().strftime("%Y-%m-%d")
+    cache_key = (name, log_level, today)
+    cached = _LOGGER_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     # Create logs directory
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
     # Create log file with date
-    today = datetime.now().strftime("%Y-%m-%d")
     log_file = log_dir / f"bot_{today}.log"
     
     # Configure logger
@@ -91,8 +145,8 @@ def setup_logger(name: str = "binance_bot", log_level: int = logging.INFO):
     # Prevent propagation to root logger
     logger.propagate = False
     
-    # File handler with structured format
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # File handler with structured format (buffered; it only runs on the listener thread)
+    file_handler = BufferedFileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(log_level)
     file_formatter = StructuredFormatter()
     file_handler.setFormatter(file_formatter)
@@ -106,12 +160,40 @@ def setup_logger(name: str = "binance_bot", log_level: int = logging.INFO):
     )
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    # Hand records to a background listener that owns the file and console handlers
+    if name in _listeners:
+        previous = _listeners.pop(name)
+        previous.stop()
+        for handler in previous.handlers:
+            handler.close()  # Flush the buffered file before it is replaced
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    listener = DrainFlushQueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    
+    # Earlier configurations of this logger are superseded by this one
+    for key in [k for k in _LOGGER_CACHE if k[0] == name]:
+        del _LOGGER_CACHE[key]
+    _LOGGER_CACHE[cache_key] = logger
     return logger
 
+@atexit.register
+def _stop_listeners():
+    """Flush queued records before the interpreter exits"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+# LogRecord attributes that can't be overwritten through extra
+_RESERVED_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs', 'message',
+    'pathname', 'process', 'processName', 'relativeCreated', 'thread',
+    'threadName', 'exc_info', 'exc_text', 'stack_info'
+})
+
 def log_order_action(logger: logging.Logger, action: str, **kwargs):
     """
     Helper function to log order actions with structured data
@@ -120,22 +202,23 @@ def log_order_action(logger: logging.Logger, action: str, **kwargs):
         logger: Logger instance
         action: Action type (e.g., 'ORDER_PLACED', 'ORDER_EXECUTED', 'ORDER_FAILED')
         **kwargs: Additional fields to log (order_id, symbol, side, quantity, price, msg, etc.)
+                  Pass args=(...) to use message as a %-style format, rendered only if emitted
     """
+    # Nothing below is needed if INFO records are filtered out anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     # Extract message separately (use 'msg' to avoid conflict with LogRecord.message)
-    msg = kwargs.pop('message', kwargs.pop('msg', f"{action}"))
+    msg = kwargs.pop('message', kwargs.pop('msg', action))
+    args = kwargs.pop('args', ())
     
     # Build extra dict, avoiding reserved LogRecord attributes
-    reserved_attrs = {'name', 'msg', 'args', 'created', 'filename', 'funcName', 
-                     'levelname', 'levelno', 'lineno', 'module', 'msecs', 'message',
-                     'pathname', 'process', 'processName', 'relativeCreated', 'thread',
-                     'threadName', 'exc_info', 'exc_text', 'stack_info'}
-    
-    extra = {'action': action}
-    for key, value in kwargs.items():
-        if key not in reserved_attrs:
-            extra[key] = value
+    extra = {'action': action, **{k: v for k, v in kwargs.items() if k not in _RESERVED_ATTRS}}
     
-    logger.info(f"{action}: {msg}", extra=extra)
+    if args:
+        logger.info("%s: " + msg, action, *args, extra=extra)
+    else:
+        logger.info("%s: %s", action, msg, extra=extra)
 
 # Global logger instance
 logger = setup_logger()
\ No newline at end of file
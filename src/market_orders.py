@@ -1,13 +1,16 @@
-from decimal import Decimal
-from .client import BinanceFuturesClient
+import math
+from .client import BinanceFuturesClient, get_shared_client
 from .validators import OrderValidator
 from .logger import logger, log_order_action
 
+# Quantity step for each precision (10 ** -i), precomputed for every precision Binance can report
+_STEP = tuple(10.0 ** -i for i in range(19))
+
 class MarketOrder:
     """Handle market orders"""
     
     def __init__(self, client: BinanceFuturesClient = None):
-        self.client = client or BinanceFuturesClient()
+        self.client = client or get_shared_client()
         self.validator = OrderValidator()
     
     def execute(self, symbol: str, side: str, quantity: str):
@@ -15,10 +18,10 @@ class MarketOrder:
         
         log_order_action(logger, 'ORDER_INITIATED', 
                         symbol=symbol, side=side.upper(), quantity=quantity,
-                        order_type='MARKET', message=f"Market {side} order initiated")
+                        order_type='MARKET', message="Market %s order initiated", args=(side,))
         
         # Validate inputs
-        is_valid, error_msg = self.validator.validate_symbol(symbol)
+        is_valid, error_msg = self.validator.validate_symbol_fast(symbol, self.client.known_symbols)
         if not is_valid:
             log_order_action(logger, 'VALIDATION_FAILED', 
                            symbol=symbol, error_code='INVALID_SYMBOL', message=error_msg)
@@ -38,36 +41,33 @@ class MarketOrder:
         
         try:
             # Get current price
-            current_price = Decimal(str(self.client.get_price(symbol)))
-            current_price_float = float(current_price)
+            current_price_float = self.client.get_price(symbol)
             
             # Get and apply quantity precision first
             qty_precision = self.client.get_quantity_precision(symbol)
             qty_rounded = round(float(qty), qty_precision)
             
             # If rounded quantity doesn't meet minimum notional, round up to next step
-            min_notional = float(self.validator.MIN_NOTIONAL)
+            min_notional = self.validator.MIN_NOTIONAL_F
             if qty_rounded * current_price_float < min_notional:
                 # Calculate minimum quantity needed
                 min_qty_needed = min_notional / current_price_float
-                # Round up to next valid step
-                step = 10 ** (-qty_precision)
-                qty_rounded = ((min_qty_needed // step) + 1) * step
-                qty_rounded = round(qty_rounded, qty_precision)
-                logger.info(f"Adjusted quantity to {qty_rounded} to meet minimum notional requirement")
+                # Round up to the smallest valid step meeting it (1e-9 absorbs float noise on exact steps)
+                step = _STEP[qty_precision]
+                qty_rounded = round(math.ceil(min_qty_needed / step - 1e-9) * step, qty_precision)
+                logger.info("Adjusted quantity to %s to meet minimum notional requirement", qty_rounded)
             
             # Validate minimum notional value ($100) with rounded quantity
-            qty_rounded_dec = Decimal(str(qty_rounded))
-            is_valid, error_msg = self.validator.validate_notional(qty_rounded_dec, current_price)
+            is_valid, error_msg = self.validator.validate_notional_f(qty_rounded, current_price_float)
             if not is_valid:
-                logger.error(f"Order validation failed: {error_msg}")
+                logger.error("Order validation failed: %s", error_msg)
                 return {"success": False, "error": error_msg}
             
             # Execute market order
             log_order_action(logger, 'ORDER_PLACING',
                            symbol=symbol, side=side.upper(), quantity=qty_rounded,
-                           estimated_value=f"${qty_rounded * current_price_float:.2f}",
-                           message=f"Placing MARKET {side} order")
+                           message="Placing MARKET %s order (estimated value $%.2f)",
+                           args=(side, qty_rounded * current_price_float))
             
             order = self.client.client.futures_create_order(
                 symbol=symbol,
@@ -95,5 +95,5 @@ class MarketOrder:
             error_str = str(e)
             log_order_action(logger, 'ORDER_FAILED',
                            symbol=symbol, side=side.upper(), error_code='EXECUTION_ERROR',
-                           message=f"Market order failed: {error_str}")
+                           message="Market order failed: %s", args=(error_str,))
             return {"success": False, "error": error_str}
\ No newline at end of file
@@ -1,16 +1,55 @@
 import re
 from decimal import Decimal, InvalidOperation
+from typing import Annotated
+from pydantic import BaseModel, Field, StringConstraints, ValidationError, field_validator, model_validator  # pyright: ignore[reportMissingImports]
 from .logger import logger
 
+_SIDES = frozenset(('BUY', 'SELL'))
+_MIN_REASONABLE_QTY = Decimal('0.00000001')  # Smaller quantities are probably input mistakes
+_NOTIONAL_EPSILON = 1e-6  # Float notionals this close to the minimum are rechecked exactly
+
+def _as_decimal(value: str | Decimal | float | int) -> Decimal:
+    """Convert a numeric string or number to Decimal, skipping the string parse for numbers"""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(repr(value))  # Shortest round-trip form, not the binary expansion
+    return Decimal(value.strip())
+
+# Repeated-warning counts, keyed by message; cleared when it reaches _WARN_KEYS_MAX entries
+_warn_counts: dict[str, int] = {}
+_WARN_KEYS_MAX = 1024
+_WARN_SUMMARY_EVERY = 1000
+
+def _warn_once(message: str):
+    """Log a warning on its first occurrence, then only a running count every _WARN_SUMMARY_EVERY repeats"""
+    count = _warn_counts.get(message, 0) + 1
+    if count == 1 and len(_warn_counts) >= _WARN_KEYS_MAX:
+        _warn_counts.clear()
+    _warn_counts[message] = count
+    if count == 1:
+        logger.warning(message)
+    elif count % _WARN_SUMMARY_EVERY == 0:
+        logger.warning("%s (seen %dx)", message, count)
+
+def _is_blank(value) -> bool:
+    """True for None and empty/whitespace strings (numbers are never blank)"""
+    return value is None or (isinstance(value, str) and not value.strip())
+
 class OrderValidator:
     """Validate trading inputs with comprehensive checks"""
     
     MIN_NOTIONAL = Decimal('100')  # Binance minimum order value
+    MIN_NOTIONAL_F = float(MIN_NOTIONAL)  # Same limit for float fast paths
     MAX_PRICE_THRESHOLD = Decimal('1000000000')  # Maximum reasonable price
     MAX_QUANTITY_THRESHOLD = Decimal('1000000')  # Maximum reasonable quantity
     
     # Common trading pairs pattern
     SYMBOL_PATTERN = re.compile(r'^[A-Z]{2,10}(USDT|BUSD|BTC|ETH)$')
+    # Hard requirements in one scan: 6-20 characters, no whitespace
+    SYMBOL_SHAPE = re.compile(r'\A\S{6,20}\Z')
     
     @staticmethod
     def validate_symbol(symbol: str) -> tuple[bool, str]:
@@ -21,79 +60,152 @@ class OrderValidator:
         if not symbol:
             return False, "Symbol cannot be empty"
         
-        symbol_upper = symbol.upper()
-        
-        # Length check
-        if len(symbol_upper) < 6 or len(symbol_upper) > 20:
+        # Length and whitespace checks; work out which one failed only when reporting it
+        if not OrderValidator.SYMBOL_SHAPE.match(symbol):
+            if 6 <= len(symbol) <= 20:
+                return False, f"Symbol contains spaces: {symbol}"
             return False, f"Symbol length invalid: {symbol} (must be 6-20 characters)"
         
         # Format check (basic pattern)
+        symbol_upper = symbol.upper()
         if not OrderValidator.SYMBOL_PATTERN.match(symbol_upper):
-            logger.warning(f"Symbol format may be unusual: {symbol_upper}")
+            _warn_once(f"Symbol format may be unusual: {symbol_upper}")
             # Don't fail, just warn - some symbols might not match pattern
         
-        # Check for common issues
-        if ' ' in symbol:
-            return False, f"Symbol contains spaces: {symbol}"
-        
         return True, ""
     
     @staticmethod
-    def validate_quantity(quantity: str) -> tuple[Decimal | None, str]:
+    def validate_symbol_fast(symbol: str, known_symbols) -> tuple[bool, str]:
+        """
+        Accept symbols the exchange is known to list with one set lookup,
+        falling back to validate_symbol's format checks otherwise
+        Returns: (is_valid, error_message)
+        """
+        if symbol and symbol.upper() in known_symbols:
+            return True, ""
+        return OrderValidator.validate_symbol(symbol)
+    
+    @staticmethod
+    def validate_quantity(quantity: str | Decimal | float | int) -> tuple[Decimal | None, str]:
         """
         Validate and convert quantity to Decimal with comprehensive checks
+        Numbers are accepted as-is; strings are parsed.
         Returns: (quantity_decimal, error_message)
         """
-        if not quantity or not quantity.strip():
+        if _is_blank(quantity):
             return None, "Quantity cannot be empty"
         
+        # Only the conversion can raise; the range checks below run outside the handler
         try:
-            qty = Decimal(str(quantity).strip())
-            
-            if qty <= 0:
-                return None, f"Quantity must be positive: {quantity}"
-            
-            if qty > OrderValidator.MAX_QUANTITY_THRESHOLD:
-                return None, f"Quantity too large: {quantity} (max: {OrderValidator.MAX_QUANTITY_THRESHOLD})"
-            
-            # Check for reasonable minimum (very small quantities might be errors)
-            if qty < Decimal('0.00000001'):
-                logger.warning(f"Very small quantity: {quantity}")
-            
-            return qty, ""
-            
+            qty = _as_decimal(quantity)
         except (InvalidOperation, ValueError) as e:
             return None, f"Invalid quantity format: {quantity} ({str(e)})"
+        
+        # NaN would raise on comparison, and infinities aren't quantities either
+        if not qty.is_finite():
+            return None, f"Invalid quantity format: {quantity}"
+        
+        if qty <= 0:
+            return None, f"Quantity must be positive: {quantity}"
+        
+        if qty > OrderValidator.MAX_QUANTITY_THRESHOLD:
+            return None, f"Quantity too large: {quantity} (max: {OrderValidator.MAX_QUANTITY_THRESHOLD})"
+        
+        # Check for reasonable minimum (very small quantities might be errors)
+        if qty < _MIN_REASONABLE_QTY:
+            _warn_once(f"Very small quantity: {quantity}")
+        
+        return qty, ""
     
     @staticmethod
-    def validate_price(price: str, min_price: Decimal = None, max_price: Decimal = None) -> tuple[Decimal | None, str]:
+    def validate_price(price: str | Decimal | float | int, min_price: Decimal = None,
+                       max_price: Decimal = None) -> tuple[Decimal | None, str]:
         """
         Validate price input with threshold checks
+        Numbers are accepted as-is; strings are parsed.
         Returns: (price_decimal, error_message)
         """
-        if not price or not price.strip():
+        if _is_blank(price):
             return None, "Price cannot be empty"
         
+        # Only the conversion can raise; the range checks below run outside the handler
         try:
-            price_dec = Decimal(str(price).strip())
-            
-            if price_dec <= 0:
-                return None, f"Price must be positive: {price}"
-            
-            if price_dec > OrderValidator.MAX_PRICE_THRESHOLD:
-                return None, f"Price too large: {price} (max: ${OrderValidator.MAX_PRICE_THRESHOLD})"
-            
-            # Check against min/max if provided
-            if min_price is not None and price_dec < min_price:
-                return None, f"Price below minimum: ${price_dec} < ${min_price}"
-            
-            if max_price is not None and price_dec > max_price:
-                return None, f"Price above maximum: ${price_dec} > ${max_price}"
-            
-            return price_dec, ""
-            
+            price_dec = _as_decimal(price)
         except (InvalidOperation, ValueError) as e:
             return None, f"Invalid price format: {price} ({str(e)})"
+        
+        # NaN would raise on comparison, and infinities aren't prices either
+        if not price_dec.is_finite():
+            return None, f"Invalid price format: {price}"
+        
+        if price_dec <= 0:
+            return None, f"Price must be positive: {price}"
+        
+        if price_dec > OrderValidator.MAX_PRICE_THRESHOLD:
+            return None, f"Price too large: {price} (max: ${OrderValidator.MAX_PRICE_THRESHOLD})"
+        
+        # Check against min/max if provided
+        if min_price is not None and price_dec < min_price:
+            return None, f"Price below minimum: ${price_dec} < ${min_price}"
+        
+        if max_price is not None and price_dec > max_price:
+            return None, f"Price above maximum: ${price_dec} > ${max_price}"
+        
+        return price_dec, ""
+    
+    @staticmethod
+    def validate_grid(symbol: str, lower_price: str, upper_price: str,
+                      grid_levels: int, quantity: str) -> tuple["GridParams | None", str]:
+        """
+        Validate all grid order inputs in a single pydantic pass
+        Returns: (grid_params, error_message)
+        """
+        try:
+            return GridParams(
+                symbol=symbol, lower=lower_price, upper=upper_price,
+                grid_levels=grid_levels, quantity=quantity
+            ), ""
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(loc) for loc in error['loc'])
+            message = error['msg'].removeprefix("Value error, ")
+            return None, f"Invalid {field}: {message}" if field else message
+    
+    @staticmethod
+    def validate_stop_limit(symbol: str, side: str, quantity: str,
+                            limit_price: str, stop_price: str,
+                            known_symbols=frozenset()) -> tuple[bool, dict]:
+        """
+        Validate all stop-limit inputs in one call, cheapest checks first
+        Returns: (is_valid, parsed values or {"error_code", "error"})
+        """
+        side_upper = side.upper() if side else ""
+        if side_upper not in _SIDES:
+            _, error_msg = OrderValidator.validate_side(side)
+            return False, {"error_code": "INVALID_SIDE", "error": error_msg}
+        
+        is_valid, error_msg = OrderValidator.validate_symbol_fast(symbol, known_symbols)
+        if not is_valid:
+            return False, {"error_code": "INVALID_SYMBOL", "error": error_msg}
+        
+        qty, error_msg = OrderValidator.validate_quantity(quantity)
+        if qty is None:
+            return False, {"error_code": "INVALID_QUANTITY", "error": error_msg}
+        
+        limit_price_dec, error_msg = OrderValidator.validate_price(limit_price)
+        if limit_price_dec is None:
+            return False, {"error_code": "INVALID_LIMIT_PRICE", "error": error_msg}
+        
+        stop_price_dec, error_msg = OrderValidator.validate_price(stop_price)
+        if stop_price_dec is None:
+            return False, {"error_code": "INVALID_STOP_PRICE", "error": error_msg}
+        
+        return True, {
+            "side": side_upper,
+            "quantity": qty,
+            "limit_price": limit_price_dec,
+            "stop_price": stop_price_dec
+        }
     
     @staticmethod
     def validate_side(side: str) -> tuple[bool, str]:
@@ -104,8 +216,7 @@ class OrderValidator:
         if not side:
             return False, "Order side cannot be empty"
         
-        side_upper = side.upper().strip()
-        if side_upper not in ['BUY', 'SELL']:
+        if side.upper() not in _SIDES:
             return False, f"Invalid side: {side}. Must be BUY or SELL"
         
         return True, ""
@@ -116,9 +227,30 @@ class OrderValidator:
         Validate that order notional value meets Binance minimum ($100)
         Returns: (is_valid, error_message)
         """
+        # Compare in float; only values within rounding distance of the limit need the exact Decimal product
+        notional = float(quantity) * float(price)
+        if abs(notional - OrderValidator.MIN_NOTIONAL_F) <= _NOTIONAL_EPSILON:
+            below = quantity * price < OrderValidator.MIN_NOTIONAL
+        else:
+            below = notional < OrderValidator.MIN_NOTIONAL_F
+        
+        if below:
+            min_qty = OrderValidator.MIN_NOTIONAL_F / float(price)
+            return False, (
+                f"Order value (${notional:.2f}) is below Binance minimum of ${OrderValidator.MIN_NOTIONAL}. "
+                f"Minimum quantity for this price: {min_qty:.6f}"
+            )
+        return True, ""
+    
+    @staticmethod
+    def validate_notional_f(quantity: float, price: float) -> tuple[bool, str]:
+        """
+        Float variant of validate_notional for already-rounded order values
+        Returns: (is_valid, error_message)
+        """
         notional = quantity * price
-        if notional < OrderValidator.MIN_NOTIONAL:
-            min_qty = OrderValidator.MIN_NOTIONAL / price
+        if notional < OrderValidator.MIN_NOTIONAL_F:
+            min_qty = OrderValidator.MIN_NOTIONAL_F / price
             return False, (
                 f"Order value (${notional:.2f}) is below Binance minimum of ${OrderValidator.MIN_NOTIONAL}. "
                 f"Minimum quantity for this price: {min_qty:.6f}"
@@ -148,4 +280,27 @@ class OrderValidator:
                     f"This seems unusual. Current price: ${current_price}"
                 )
         
-        return True, ""
\ No newline at end of file
+        return True, ""
+
+class GridParams(BaseModel):
+    """Grid order inputs, parsed and range-checked by pydantic-core in one pass"""
+    
+    symbol: Annotated[str, StringConstraints(strip_whitespace=True, to_upper=True,
+                                             min_length=6, max_length=20, pattern=r'^\S+$')]
+    lower: Annotated[Decimal, Field(gt=0, le=OrderValidator.MAX_PRICE_THRESHOLD)]
+    upper: Annotated[Decimal, Field(gt=0, le=OrderValidator.MAX_PRICE_THRESHOLD)]
+    grid_levels: Annotated[int, Field(ge=2)]
+    quantity: Annotated[Decimal, Field(gt=0, le=OrderValidator.MAX_QUANTITY_THRESHOLD)]
+    
+    @field_validator('symbol')
+    @classmethod
+    def _warn_unusual_symbol(cls, value: str) -> str:
+        if not OrderValidator.SYMBOL_PATTERN.match(value):
+            _warn_once(f"Symbol format may be unusual: {value}")
+        return value
+    
+    @model_validator(mode='after')
+    def _check_range(self) -> "GridParams":
+        if self.lower >= self.upper:
+            raise ValueError("Lower price must be less than upper price")
+        return self
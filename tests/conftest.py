@@ -0,0 +1,74 @@
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+import pytest  # pyright: ignore[reportMissingImports]
+from binance.exceptions import BinanceAPIException  # pyright: ignore[reportMissingImports]
+from src.client import RateLimiter
+
+def api_error(status_code: int, code: int, msg: str = "error") -> BinanceAPIException:
+    """Build a BinanceAPIException the way python-binance raises it"""
+    return BinanceAPIException(SimpleNamespace(text="", headers={}), status_code, json.dumps({"code": code, "msg": msg}))
+
+class FakeClient:
+    """Stand-in for BinanceFuturesClient serving fixed metadata"""
+    
+    testnet = True
+    
+    def __init__(self, price: float = 100.0, price_precision: int = 2, qty_precision: int = 3):
+        self.price = price
+        self.price_precision = price_precision
+        self.qty_precision = qty_precision
+        self.order_limiter = RateLimiter(1000)
+        self.known_symbols = frozenset({'BTCUSDT'})
+    
+    def get_price(self, symbol):
+        return self.price
+    
+    def get_price_raw(self, symbol):
+        return str(self.price)
+    
+    def get_symbol_precision(self, symbol):
+        return self.price_precision, self.qty_precision, 100.0, 10.0 ** -self.price_precision
+    
+    def get_quantity_precision(self, symbol):
+        return self.qty_precision
+    
+    def get_quantity_step(self, symbol):
+        return Decimal(1).scaleb(-self.qty_precision)
+    
+    def get_price_step(self, symbol):
+        return Decimal(1).scaleb(-self.price_precision)
+
+class FakeAsyncClient:
+    """
+    Stand-in for AsyncBinanceFuturesClient
+    
+    call() dispatches to handlers[method](**params); a handler may return a
+    response or raise. Every call is recorded as (method, params).
+    """
+    
+    def __init__(self, **handlers):
+        self.handlers = handlers
+        self.calls = []
+        self.closed = False
+    
+    async def call(self, method, **params):
+        self.calls.append((method, params))
+        return self.handlers[method](**params)
+    
+    async def get_client(self):
+        # The raw AsyncClient is only used for cancels here
+        return self
+    
+    async def futures_cancel_order(self, **params):
+        return await self.call('futures_cancel_order', **params)
+    
+    async def close(self):
+        self.closed = True
+    
+    def methods(self):
+        return [method for method, _ in self.calls]
+
+@pytest.fixture
+def client():
+    return FakeClient()
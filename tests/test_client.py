@@ -0,0 +1,183 @@
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+import aiohttp  # pyright: ignore[reportMissingImports]
+import pytest  # pyright: ignore[reportMissingImports]
+import src.client as client_module
+from src.client import AsyncBinanceFuturesClient, BinanceFuturesClient, RateLimiter, is_definite_rejection
+from conftest import api_error
+
+def test_refusals_are_definite_rejections():
+    assert is_definite_rejection(api_error(400, -1102))
+    assert is_definite_rejection(api_error(429, -1003))
+    assert is_definite_rejection(api_error(418, -1003))
+
+def test_unknown_outcomes_are_not_definite_rejections():
+    assert not is_definite_rejection(api_error(408, -1007))
+    assert not is_definite_rejection(api_error(503, -1001))
+    assert not is_definite_rejection(aiohttp.ServerDisconnectedError())
+    assert not is_definite_rejection(ValueError("bad payload"))
+
+def test_rate_limiter_grants_capacity_then_reports_wait():
+    limiter = RateLimiter(rate=10)
+    
+    assert limiter._reserve(10) == 0
+    assert limiter._reserve(5) == pytest.approx(0.5, abs=0.01)
+
+def test_rate_limiter_caps_requests_at_capacity():
+    limiter = RateLimiter(rate=10, capacity=5)
+    
+    # A request larger than the bucket waits for a full bucket instead of forever
+    assert limiter._reserve(50) == 0
+
+def flaky_async_client(*errors):
+    """AsyncBinanceFuturesClient whose raw client raises the given errors, then succeeds"""
+    pending = list(errors)
+    calls = []
+    
+    async def futures_create_order(**params):
+        calls.append(params)
+        if pending:
+            raise pending.pop(0)
+        return {'orderId': 1}
+    
+    async_client = AsyncBinanceFuturesClient(testnet=True)
+    async_client._client = SimpleNamespace(futures_create_order=futures_create_order)
+    return async_client, calls
+
+def test_call_retries_rate_limit_rejections():
+    async_client, calls = flaky_async_client(api_error(429, -1003), api_error(418, -1003))
+    
+    order = asyncio.run(async_client.call('futures_create_order', initial_wait=0, symbol='BTCUSDT'))
+    
+    assert order == {'orderId': 1}
+    assert len(calls) == 3
+
+def test_call_does_not_retry_unknown_outcomes():
+    async_client, calls = flaky_async_client(api_error(408, -1007))
+    
+    with pytest.raises(Exception, match='-1007'):
+        asyncio.run(async_client.call('futures_create_order', initial_wait=0, symbol='BTCUSDT'))
+    assert len(calls) == 1
+
+def test_call_gives_up_after_its_attempts():
+    async_client, calls = flaky_async_client(*[api_error(429, -1003)] * 3)
+    
+    with pytest.raises(Exception, match='-1003'):
+        asyncio.run(async_client.call('futures_create_order', attempts=2, initial_wait=0))
+    assert len(calls) == 2
+
+EXCHANGE_INFO = {'symbols': [
+    {'symbol': 'BTCUSDT', 'status': 'TRADING', 'filters': [
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.10', 'maxPrice': '1000000', 'tickSize': '0.10'},
+        {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'maxQty': '1000', 'stepSize': '0.00100000'},
+        {'filterType': 'MIN_NOTIONAL', 'notional': '100'},
+    ]},
+    {'symbol': 'DOGEUSDT', 'status': 'TRADING', 'filters': [
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.000010', 'maxPrice': '30', 'tickSize': '0.000010'},
+        {'filterType': 'LOT_SIZE', 'minQty': '1', 'maxQty': '10000000', 'stepSize': '1'},
+    ]},
+]}
+
+class FakeRestClient:
+    """Stand-in for python-binance's Client counting metadata requests"""
+    
+    def __init__(self):
+        self.exchange_info_calls = 0
+        self.ticker_calls = 0
+        self.price = '50000.10'
+    
+    def futures_exchange_info(self):
+        self.exchange_info_calls += 1
+        return EXCHANGE_INFO
+    
+    def futures_symbol_ticker(self, symbol):
+        self.ticker_calls += 1
+        return {'symbol': symbol, 'price': self.price}
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the client's TTL caches"""
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, 'monotonic', lambda: now[0])
+    return now
+
+@pytest.fixture
+def rest_client(clock):
+    """BinanceFuturesClient over a fake REST client, skipping the credential and session setup"""
+    client = BinanceFuturesClient.__new__(BinanceFuturesClient)
+    client.client = FakeRestClient()
+    client._precision_cache = {}
+    client._price_cache = {}
+    client._symbol_index = None
+    return client
+
+def test_precision_comes_from_the_exchange_filters(rest_client):
+    assert rest_client.get_symbol_precision('btcusdt') == (1, 3, 100.0, 0.1)
+    assert rest_client.get_symbol_precision('DOGEUSDT') == (5, 0, 0.0, 0.00001)
+
+def test_precision_is_cached_per_symbol(rest_client, clock):
+    rest_client.get_symbol_precision('BTCUSDT')
+    rest_client._symbol_index = None  # Any refetch would now show up in the call count
+    
+    clock[0] += rest_client.PRECISION_CACHE_TTL - 1
+    rest_client.get_symbol_precision('BTCUSDT')
+    assert rest_client.client.exchange_info_calls == 1
+    
+    clock[0] += 1
+    rest_client.get_symbol_precision('BTCUSDT')
+    assert rest_client.client.exchange_info_calls == 2
+
+def test_price_is_cached_briefly(rest_client, clock):
+    assert rest_client.get_price('BTCUSDT') == 50000.1
+    rest_client.client.price = '50001.00'
+    assert rest_client.get_price_raw('BTCUSDT') == '50000.10'
+    
+    clock[0] += rest_client.PRICE_CACHE_TTL
+    assert rest_client.get_price_raw('BTCUSDT') == '50001.00'
+    assert rest_client.client.ticker_calls == 2
+
+def test_invalidate_symbol_only_for_stale_filter_errors(rest_client):
+    rest_client.get_symbol_precision('BTCUSDT')
+    
+    rest_client.invalidate_symbol('BTCUSDT', api_error(400, -2019))
+    assert 'BTCUSDT' in rest_client._precision_cache
+    
+    rest_client.invalidate_symbol('btcusdt', api_error(400, -1111))
+    assert 'BTCUSDT' not in rest_client._precision_cache
+    rest_client.get_symbol_precision('BTCUSDT')
+    assert rest_client.client.exchange_info_calls == 2
+
+def test_exchange_info_is_fetched_once_per_ttl(rest_client, clock):
+    rest_client.get_symbol_info('BTCUSDT')
+    rest_client.get_symbol_info('DOGEUSDT')
+    assert rest_client.validate_symbol('btcusdt')
+    assert rest_client.client.exchange_info_calls == 1
+    
+    clock[0] += rest_client.EXCHANGE_INFO_CACHE_TTL
+    rest_client.get_symbol_info('BTCUSDT')
+    assert rest_client.client.exchange_info_calls == 2
+
+def test_symbol_index_holds_parsed_filters(rest_client):
+    info = rest_client.get_symbol_info('btcusdt')
+    
+    assert info['status'] == 'TRADING'
+    assert info['filters']['quantity'] == {'minQty': 0.001, 'maxQty': 1000.0, 'stepSize': 0.001}
+    assert info['filters']['notional'] == {'minNotional': 100.0}
+    assert not rest_client.validate_symbol('ETHUSDT')
+    with pytest.raises(ValueError):
+        rest_client.get_symbol_info('ETHUSDT')
+
+def test_invalidate_symbol_drops_the_symbol_index(rest_client):
+    rest_client.get_symbol_info('BTCUSDT')
+    
+    rest_client.invalidate_symbol('BTCUSDT')
+    rest_client.get_symbol_info('BTCUSDT')
+    
+    assert rest_client.client.exchange_info_calls == 2
+
+def test_steps_are_exact_decimals(rest_client):
+    assert rest_client.get_quantity_step('BTCUSDT') == Decimal('0.001')
+    assert str(rest_client.get_quantity_step('BTCUSDT')) == '0.001'
+    assert rest_client.get_price_step('DOGEUSDT') == Decimal('0.00001')
+    assert rest_client.get_quantity_step('DOGEUSDT') == Decimal('1')
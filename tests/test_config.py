@@ -0,0 +1,18 @@
+import importlib
+import src.config
+
+def test_dotenv_file_is_skipped_when_credentials_are_exported(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("FUTURES_TESTNET=false\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('BINANCE_API_KEY', 'key')
+    monkeypatch.setenv('BINANCE_API_SECRET', 'secret')
+    monkeypatch.delenv('FUTURES_TESTNET', raising=False)
+    try:
+        config = importlib.reload(src.config)
+        
+        assert config.Settings.model_config['env_file'] is None
+        assert config.settings.BINANCE_API_KEY == 'key'
+        assert config.settings.FUTURES_TESTNET is True
+    finally:
+        monkeypatch.undo()
+        importlib.reload(src.config)
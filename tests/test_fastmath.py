@@ -0,0 +1,28 @@
+import numpy as np  # pyright: ignore[reportMissingImports]
+from src.advanced._fastmath import round_and_check, round_and_check_many
+
+def test_rounds_to_exchange_precision():
+    assert round_and_check(0.12345, 50000.123, 49900.987, 3, 2, 100.0) == (0.123, 50000.12, 49900.99, True)
+
+def test_minimum_on_a_step_is_not_oversized():
+    assert round_and_check(0.001, 50000.0, 50000.0, 3, 2, 100.0)[0] == 0.002
+    assert round_and_check(1.0, 10.0, 10.0, 3, 2, 100.0)[0] == 10.0
+
+def test_minimum_between_steps_rounds_up():
+    qty, *_, meets = round_and_check(0.001, 30000.0, 30000.0, 3, 2, 100.0)
+    
+    assert qty == 0.004
+    assert meets
+
+def test_vectorised_matches_scalar():
+    qtys = np.array([0.001, 1.0, 0.001, 0.12345])
+    limits = np.array([50000.0, 10.0, 30000.0, 50000.123])
+    stops = np.array([50000.0, 10.0, 30000.0, 49900.987])
+    qty_precisions = np.array([3, 3, 3, 3])
+    price_precisions = np.array([2, 2, 2, 2])
+    
+    many = round_and_check_many(qtys, limits, stops, qty_precisions, price_precisions, 100.0)
+    
+    for k in range(len(qtys)):
+        scalar = round_and_check(qtys[k], limits[k], stops[k], 3, 2, 100.0)
+        assert tuple(column[k] for column in many) == scalar
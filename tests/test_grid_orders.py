@@ -0,0 +1,72 @@
+import asyncio
+import json
+import aiohttp  # pyright: ignore[reportMissingImports]
+from src.advanced.grid_orders import GridOrder
+from conftest import FakeAsyncClient, api_error
+
+def make_grid(client, **handlers):
+    grid = GridOrder(client=client)
+    grid.async_client = FakeAsyncClient(**handlers)
+    return grid
+
+def run_grid(grid):
+    # Levels at 90, 95, 100, 105, 110 around a price of 100: two buys and two sells, one batch
+    return asyncio.run(grid.execute_async('BTCUSDT', '90', '110', 5, '2'))
+
+def created_order(**params):
+    return {'orderId': float(params['price']), 'status': 'NEW'}
+
+def batch_accepting_all(batchOrders):
+    return [created_order(**order) for order in json.loads(batchOrders)]
+
+def test_batch_places_every_level(client):
+    grid = make_grid(client, futures_place_batch_order=batch_accepting_all)
+    
+    result = run_grid(grid)
+    
+    assert result['success']
+    assert (result['orders_placed'], result['buy_orders'], result['sell_orders']) == (4, 2, 2)
+    assert grid.async_client.methods() == ['futures_place_batch_order']
+    assert grid.async_client.closed
+
+def test_only_rejected_batch_entries_are_replaced(client):
+    def batch(batchOrders):
+        responses = batch_accepting_all(batchOrders)
+        responses[1] = {'code': -2019, 'msg': 'Margin is insufficient.'}
+        return responses
+    
+    grid = make_grid(client, futures_place_batch_order=batch, futures_create_order=created_order)
+    
+    result = run_grid(grid)
+    
+    assert result['orders_placed'] == 4
+    creates = [params for method, params in grid.async_client.calls if method == 'futures_create_order']
+    assert [params['price'] for params in creates] == ['95.00']
+
+def test_refused_batch_falls_back_to_individual_orders(client):
+    def batch(batchOrders):
+        raise api_error(400, -1102, 'Mandatory parameter was not sent')
+    
+    grid = make_grid(client, futures_place_batch_order=batch, futures_create_order=created_order)
+    
+    result = run_grid(grid)
+    
+    assert result['orders_placed'] == 4
+    assert grid.async_client.methods().count('futures_create_order') == 4
+
+def test_unknown_batch_outcome_is_not_replaced(client):
+    errors = [
+        aiohttp.ServerDisconnectedError(),
+        api_error(503, -1001, 'Internal error'),
+        api_error(408, -1007, 'Timeout waiting for response from backend server'),
+    ]
+    for error in errors:
+        def batch(batchOrders, error=error):
+            raise error
+        
+        grid = make_grid(client, futures_place_batch_order=batch, futures_create_order=created_order)
+        
+        result = run_grid(grid)
+        
+        assert result['orders_placed'] == 0
+        assert 'futures_create_order' not in grid.async_client.methods()
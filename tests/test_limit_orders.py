@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+import pytest  # pyright: ignore[reportMissingImports]
+from src.limit_orders import LimitOrder
+from conftest import FakeClient
+
+def place_limit(side, quantity, price):
+    placed = []
+    
+    def futures_create_order(**params):
+        placed.append(params)
+        return {'orderId': 1, 'symbol': params['symbol'], 'side': params['side'],
+                'origQty': params['quantity'], 'price': params['price'], 'status': 'NEW'}
+    
+    client = FakeClient()
+    client.client = SimpleNamespace(futures_create_order=futures_create_order)
+    result = LimitOrder(client=client).execute('BTCUSDT', side, quantity, price)
+    return result, placed
+
+@pytest.mark.parametrize('quantity, price, expected_qty, expected_price', [
+    ('1.23456', '100.005', '1.234', '100.00'),  # Half a tick rounds to the even tick
+    ('1.23456', '100.015', '1.234', '100.02'),
+    ('2', '99.999', '2.000', '100.00'),
+])
+def test_limit_rounds_to_exact_steps(quantity, price, expected_qty, expected_price):
+    result, placed = place_limit('buy', quantity, price)
+    
+    assert result['success']
+    assert (placed[0]['quantity'], placed[0]['price']) == (expected_qty, expected_price)
+
+def test_short_quantity_raised_to_exact_minimum():
+    result, placed = place_limit('sell', '0.5', '100')
+    
+    assert result['success']
+    # 100 USDT at 100 is exactly 1.000, not one step more
+    assert placed[0]['quantity'] == '1.000'
+
+def test_limit_price_far_from_market_rejected():
+    result, placed = place_limit('buy', '2', '111')
+    
+    assert not result['success']
+    assert placed == []
@@ -0,0 +1,102 @@
+import logging
+import queue
+import time
+from datetime import datetime
+from src.logger import (BufferedFileHandler, DrainFlushQueueListener, StructuredFormatter,
+                        _format_timestamp, log_order_action, setup_logger)
+
+def make_record(level=logging.INFO, msg="order placed", **extra):
+    record = logging.LogRecord("binance_bot", level, __file__, 1, msg, (), None)
+    record.__dict__.update(extra)
+    return record
+
+def test_buffered_handler_holds_info_and_flushes_errors(tmp_path):
+    log_file = tmp_path / "bot.log"
+    handler = BufferedFileHandler(log_file, encoding='utf-8')
+    
+    handler.emit(make_record())
+    assert log_file.read_text() == ""
+    
+    handler.emit(make_record(logging.ERROR, "order failed"))
+    assert log_file.read_text().splitlines() == ["order placed", "order failed"]
+    handler.close()
+
+def test_listener_flushes_once_the_queue_drains(tmp_path):
+    log_file = tmp_path / "bot.log"
+    handler = BufferedFileHandler(log_file, encoding='utf-8')
+    log_queue = queue.Queue()
+    listener = DrainFlushQueueListener(log_queue, handler)
+    listener.start()
+    try:
+        log_queue.put(make_record())
+        deadline = time.monotonic() + 2
+        while log_file.read_text() == "" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        # On disk while the listener is still running, not only at stop()/exit
+        assert log_file.read_text() == "order placed\n"
+    finally:
+        listener.stop()
+        handler.close()
+
+def test_timestamps_match_isoformat_within_and_across_seconds():
+    base = 1_760_000_000.0
+    for created in (base + 0.25, base + 0.5, base + 1.75, base + 0.125):
+        assert _format_timestamp(created) == datetime.fromtimestamp(created).isoformat(timespec='microseconds')
+
+def test_structured_format_renders_extras_in_field_order():
+    record = make_record(msg="placed %s", price=101.5, action='ORDER_PLACED', symbol='BTCUSDT')
+    record.args = ('order',)
+    
+    line = StructuredFormatter().format(record)
+    
+    assert line.split(" | ")[1:] == ["INFO", "ACTION=ORDER_PLACED", "SYMBOL=BTCUSDT", "PRICE=101.5", "MSG=placed order"]
+
+def test_structured_format_appends_events_as_json():
+    record = make_record(events=[{"event": "placed", "level": 1}])
+    
+    line = StructuredFormatter().format(record)
+    
+    assert line.endswith('MSG=order placed | EVENTS=[{"event": "placed", "level": 1}]')
+
+class CaptureHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+def capture_logger(level=logging.INFO):
+    capture = logging.getLogger("test_order_actions")
+    capture.handlers = [CaptureHandler()]
+    capture.propagate = False
+    capture.setLevel(level)
+    return capture, capture.handlers[0].records
+
+def test_log_order_action_drops_reserved_attributes():
+    capture, records = capture_logger()
+    
+    log_order_action(capture, 'ORDER_PLACED', symbol='BTCUSDT', name='clash', args=('42',),
+                     message="Order %s placed")
+    
+    record, = records
+    assert record.getMessage() == "ORDER_PLACED: Order 42 placed"
+    assert (record.action, record.symbol, record.name) == ('ORDER_PLACED', 'BTCUSDT', 'test_order_actions')
+
+def test_log_order_action_skips_work_when_info_is_disabled():
+    capture, records = capture_logger(logging.WARNING)
+    
+    log_order_action(capture, 'ORDER_PLACED', symbol='BTCUSDT', message="Order placed")
+    
+    assert records == []
+
+def test_setup_logger_reuses_the_configured_logger(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    
+    first = setup_logger("test_cached_logger")
+    second = setup_logger("test_cached_logger")
+    
+    assert first is second
+    assert len(first.handlers) == 1
+    assert list((tmp_path / "logs").iterdir())
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+import pytest  # pyright: ignore[reportMissingImports]
+from src.market_orders import MarketOrder
+from conftest import FakeClient
+
+def place_market(price, quantity, qty_precision=3):
+    placed = []
+    
+    def futures_create_order(**params):
+        placed.append(params)
+        return {'orderId': 1, 'symbol': params['symbol'], 'side': params['side'],
+                'origQty': str(params['quantity']), 'avgPrice': str(price), 'status': 'FILLED'}
+    
+    client = FakeClient(price=price, qty_precision=qty_precision)
+    client.client = SimpleNamespace(futures_create_order=futures_create_order)
+    result = MarketOrder(client=client).execute('BTCUSDT', 'buy', quantity)
+    return result, placed
+
+@pytest.mark.parametrize('price, quantity, expected', [
+    (50000.0, '0.01234', 0.012),  # Enough notional: rounded to precision only
+    (50000.0, '0.001', 0.002),  # Minimum falls exactly on a step: no extra step
+    (50000.0, '0.0014', 0.002),
+    (30000.0, '0.001', 0.004),  # 0.00333... rounds up to the next step
+    (10.0, '1', 10.0),
+])
+def test_market_quantity_rounding(price, quantity, expected):
+    result, placed = place_market(price, quantity)
+    
+    assert result['success']
+    assert placed[0]['quantity'] == expected
+    assert placed[0]['side'] == 'BUY'
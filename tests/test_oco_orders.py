@@ -0,0 +1,93 @@
+import asyncio
+import aiohttp  # pyright: ignore[reportMissingImports]
+import pytest  # pyright: ignore[reportMissingImports]
+from src.advanced.oco_orders import OCOOrder
+from conftest import FakeAsyncClient
+
+TP_ORDER = {'orderId': 1, 'status': 'NEW', 'price': '110.00'}
+SL_ORDER = {'orderId': 2, 'status': 'NEW', 'stopPrice': '90.00'}
+UNSUPPORTED = {'code': -4120, 'msg': 'Order type not supported for this endpoint.'}
+
+def make_oco(client, **handlers):
+    oco = OCOOrder(client=client)
+    oco.async_client = FakeAsyncClient(futures_cancel_order=lambda **params: {}, **handlers)
+    return oco
+
+def run_oco(oco):
+    return asyncio.run(oco.execute_async('BTCUSDT', 'BUY', '2', '110', '90'))
+
+def cancelled_ids(oco):
+    return [params['orderId'] for method, params in oco.async_client.calls if method == 'futures_cancel_order']
+
+def test_both_legs_placed(client):
+    oco = make_oco(client, futures_place_batch_order=lambda batchOrders: [TP_ORDER, SL_ORDER])
+    
+    result = run_oco(oco)
+    
+    assert result['success']
+    assert (result['take_profit']['order_id'], result['stop_loss']['order_id']) == (1, 2)
+    assert cancelled_ids(oco) == []
+
+def test_failed_take_profit_cancels_stop_loss(client):
+    rejected = {'code': -2019, 'msg': 'Margin is insufficient.'}
+    oco = make_oco(client, futures_place_batch_order=lambda batchOrders: [rejected, SL_ORDER])
+    
+    result = run_oco(oco)
+    
+    assert not result['success']
+    assert cancelled_ids(oco) == [2]
+
+def test_failed_stop_loss_cancels_take_profit(client):
+    rejected = {'code': -2021, 'msg': 'Order would immediately trigger.'}
+    oco = make_oco(client, futures_place_batch_order=lambda batchOrders: [TP_ORDER, rejected])
+    
+    result = run_oco(oco)
+    
+    assert not result['success']
+    assert cancelled_ids(oco) == [1]
+
+def test_unsupported_stop_loss_retried_reduce_only(client):
+    oco = make_oco(client, futures_place_batch_order=lambda batchOrders: [TP_ORDER, UNSUPPORTED],
+                   futures_create_order=lambda **params: SL_ORDER)
+    
+    result = run_oco(oco)
+    
+    assert result['success']
+    _, params = oco.async_client.calls[-1]
+    assert (params['reduceOnly'], params['workingType']) == ('true', 'MARK_PRICE')
+
+def test_stop_loss_retry_transport_error_cancels_take_profit(client):
+    def create_order(**params):
+        raise aiohttp.ServerDisconnectedError()
+    
+    oco = make_oco(client, futures_place_batch_order=lambda batchOrders: [TP_ORDER, UNSUPPORTED],
+                   futures_create_order=create_order)
+    
+    result = run_oco(oco)
+    
+    assert not result['success']
+    assert cancelled_ids(oco) == [1]
+
+def test_watcher_retries_transient_errors(client):
+    oco = make_oco(client)
+    oco.MONITOR_RETRY_DELAY = 0
+    attempts = []
+    
+    async def flaky_watcher():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("User data stream error")
+        return 'TP', 'FILLED'
+    
+    assert asyncio.run(oco._with_retries('TP', flaky_watcher)) == ('TP', 'FILLED')
+    assert len(attempts) == 3
+
+def test_watcher_gives_up_after_repeated_errors(client):
+    oco = make_oco(client)
+    oco.MONITOR_RETRY_DELAY = 0
+    
+    async def broken_watcher():
+        raise RuntimeError("Mark price stream error")
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(oco._with_retries('SL', broken_watcher))
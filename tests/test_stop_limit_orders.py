@@ -0,0 +1,63 @@
+import json
+from types import SimpleNamespace
+from src.advanced.stop_limit_orders import OrderResult, StopLimitOrder
+
+def accepted(order):
+    return {'orderId': float(order['stopPrice']), 'symbol': order['symbol'], 'side': order['side'],
+            'origQty': order['quantity'], 'price': order['price'], 'stopPrice': order['stopPrice'],
+            'status': 'NEW'}
+
+def make_stop_limit(client, place_batch):
+    client.client = SimpleNamespace(futures_place_batch_order=place_batch)
+    return StopLimitOrder(client=client)
+
+def test_order_result_as_dict_drops_unset_fields():
+    result = OrderResult(success=False, error="Invalid side")
+    
+    assert result.as_dict() == {'success': False, 'error': "Invalid side"}
+    assert result.get('order_id', 'n/a') == 'n/a'
+
+def test_execute_returns_a_plain_dict(client):
+    result = StopLimitOrder(client=client).execute('BTCUSDT', 'HOLD', '1', '106', '105')
+    
+    assert type(result) is dict
+    assert result['success'] is False and 'Invalid side' in result['error']
+
+def test_execute_many_returns_plain_dicts_in_input_order(client):
+    def place_batch(batchOrders):
+        orders = json.loads(batchOrders)
+        responses = [accepted(order) for order in orders]
+        responses[1] = {'code': -2019, 'msg': 'Margin is insufficient.'}
+        return responses
+    
+    stop_limit = make_stop_limit(client, place_batch)
+    
+    results = stop_limit.execute_many([
+        {'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': '1', 'limit_price': '106', 'stop_price': '105'},
+        {'symbol': 'BTCUSDT', 'side': 'SELL', 'quantity': '2', 'limit_price': '94', 'stop_price': '95'},
+        {'symbol': 'BTCUSDT', 'side': 'HOLD', 'quantity': '1', 'limit_price': '106', 'stop_price': '105'},
+        {'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': '1', 'limit_price': '104', 'stop_price': '105'},
+    ])
+    
+    assert all(type(result) is dict for result in results)
+    json.dumps(results)
+    assert results[0]['success'] and results[0]['stop_price'] == '105.00'
+    assert results[1] == {'success': False, 'error': "code=-2019, Margin is insufficient."}
+    assert 'Invalid side' in results[2]['error']
+    assert 'Limit price' in results[3]['error']
+
+def test_execute_many_raises_short_orders_to_the_minimum_notional(client):
+    placed = []
+    
+    def place_batch(batchOrders):
+        placed.extend(json.loads(batchOrders))
+        return [accepted(order) for order in placed]
+    
+    stop_limit = make_stop_limit(client, place_batch)
+    
+    results = stop_limit.execute_many([
+        {'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': '0.5', 'limit_price': '125', 'stop_price': '120'},
+    ])
+    
+    assert results[0]['success']
+    assert placed[0]['quantity'] == '0.800'
@@ -0,0 +1,114 @@
+import asyncio
+import itertools
+import time
+import pytest  # pyright: ignore[reportMissingImports]
+from src.advanced.twap_orders import TWAPOrder
+from conftest import FakeAsyncClient, api_error
+
+def make_twap(client, create_order):
+    twap = TWAPOrder(client=client)
+    twap.async_client = FakeAsyncClient(futures_create_order=create_order)
+    return twap
+
+def filled_orders():
+    """futures_create_order handler returning sequentially numbered fills"""
+    ids = itertools.count(1)
+    return lambda **params: {'orderId': next(ids), 'origQty': str(params['quantity']),
+                             'avgPrice': '100', 'status': 'FILLED'}
+
+def test_cancel_after_first_slice_returns_partial_orders(client):
+    fill = filled_orders()
+    
+    def create_order(**params):
+        twap.cancel()
+        return fill(**params)
+    
+    twap = make_twap(client, create_order)
+    
+    result = asyncio.run(twap.execute_async('BTCUSDT', 'BUY', '3', 1, num_slices=3))
+    
+    assert result['error'] == "Order cancelled"
+    assert [order['order_id'] for order in result['partial_orders']] == [1]
+    assert twap.async_client.closed
+
+def test_cancel_during_setup_places_nothing(client):
+    fetch_price = client.get_price
+    
+    def get_price(symbol):
+        twap.cancel()
+        return fetch_price(symbol)
+    
+    client.get_price = get_price
+    twap = make_twap(client, filled_orders())
+    
+    result = asyncio.run(twap.execute_async('BTCUSDT', 'BUY', '3', 1, num_slices=3))
+    
+    assert result['error'] == "Order cancelled"
+    assert result['partial_orders'] == []
+    assert twap.async_client.calls == []
+
+def test_failed_slice_returns_partial_orders(client):
+    fill = filled_orders()
+    
+    def create_order(**params):
+        if twap.async_client.calls[1:]:
+            raise api_error(400, -2019, 'Margin is insufficient.')
+        return fill(**params)
+    
+    twap = make_twap(client, create_order)
+    
+    # 0.001 minutes spread over three slices keeps the waits around 20ms
+    result = asyncio.run(twap.execute_async('BTCUSDT', 'BUY', '3', 0.001, num_slices=3))
+    
+    assert not result['success']
+    assert 'Margin is insufficient' in result['error']
+    assert [order['order_id'] for order in result['partial_orders']] == [1]
+
+def test_failed_burst_returns_partial_orders(client):
+    fill = filled_orders()
+    
+    def create_order(**params):
+        calls = len(twap.async_client.calls)
+        if calls == 1:
+            time.sleep(0.05)  # Fall behind so the next two slices go out as one burst
+        if calls == 3:
+            raise api_error(400, -2019, 'Margin is insufficient.')
+        return fill(**params)
+    
+    twap = make_twap(client, create_order)
+    
+    result = asyncio.run(twap.execute_async('BTCUSDT', 'BUY', '3', 0.001, num_slices=3))
+    
+    assert not result['success']
+    assert [order['order_id'] for order in result['partial_orders']] == [1, 2]
+
+def test_task_cancellation_propagates(client):
+    twap = make_twap(client, filled_orders())
+    
+    async def run_and_cancel():
+        task = asyncio.create_task(twap.execute_async('BTCUSDT', 'BUY', '3', 1, num_slices=3))
+        while not twap.async_client.calls:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)  # Let the run reach the wait before slice two
+        task.cancel()
+        await task
+    
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run_and_cancel())
+    assert len(twap._orders) == 1
+    assert twap.async_client.closed
+
+def test_keyboard_interrupt_returns_partial_orders_from_execute(client):
+    fill = filled_orders()
+    
+    def create_order(**params):
+        if twap.async_client.calls[1:]:
+            raise KeyboardInterrupt
+        return fill(**params)
+    
+    twap = make_twap(client, create_order)
+    
+    result = twap.execute('BTCUSDT', 'BUY', '3', 0.001, num_slices=3)
+    
+    assert result['error'] == "Order interrupted"
+    assert [order['order_id'] for order in result['partial_orders']] == [1]
@@ -0,0 +1,129 @@
+from decimal import Decimal
+import pytest  # pyright: ignore[reportMissingImports]
+from src import validators
+from src.validators import OrderValidator
+
+def test_grid_params_parse_and_normalise():
+    params, error = OrderValidator.validate_grid(' btcusdt ', '90', '110.5', 5, '0.01')
+    
+    assert error == ""
+    assert (params.symbol, params.lower, params.upper, params.quantity) == ('BTCUSDT', Decimal('90'), Decimal('110.5'), Decimal('0.01'))
+
+@pytest.mark.parametrize('lower, upper, levels, quantity, field', [
+    ('110', '90', 5, '1', 'Lower price must be less than upper price'),
+    ('90', '110', 1, '1', 'grid_levels'),
+    ('-1', '110', 5, '1', 'lower'),
+    ('90', 'abc', 5, '1', 'upper'),
+    ('90', '110', 5, '0', 'quantity'),
+])
+def test_grid_params_reject_bad_input(lower, upper, levels, quantity, field):
+    params, error = OrderValidator.validate_grid('BTCUSDT', lower, upper, levels, quantity)
+    
+    assert params is None
+    assert field in error
+
+@pytest.mark.parametrize('symbol, error', [
+    ('', "Symbol cannot be empty"),
+    ('BTC', "Symbol length invalid"),
+    ('B' * 21, "Symbol length invalid"),
+    ('BTC USDT', "Symbol contains spaces"),
+])
+def test_symbol_shape_errors(symbol, error):
+    is_valid, message = OrderValidator.validate_symbol(symbol)
+    
+    assert not is_valid
+    assert message.startswith(error)
+
+def test_unusual_symbol_only_warns():
+    assert OrderValidator.validate_symbol('1000PEPEUSDC') == (True, "")
+
+def test_known_symbols_skip_the_format_checks():
+    assert OrderValidator.validate_symbol_fast('btcusdt', frozenset({'BTCUSDT'})) == (True, "")
+    assert not OrderValidator.validate_symbol_fast('BTC', frozenset({'BTCUSDT'}))[0]
+
+@pytest.mark.parametrize('value, expected', [
+    (Decimal('0.5'), Decimal('0.5')),
+    (0.1, Decimal('0.1')),
+    (3, Decimal('3')),
+    (' 1.25 ', Decimal('1.25')),
+])
+def test_numeric_inputs_convert_without_float_noise(value, expected):
+    assert OrderValidator.validate_quantity(value) == (expected, "")
+    assert OrderValidator.validate_price(value) == (expected, "")
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), float('-inf'), 'NaN', 'Infinity', Decimal('sNaN')])
+def test_non_finite_values_are_rejected(value):
+    qty, error = OrderValidator.validate_quantity(value)
+    price, price_error = OrderValidator.validate_price(value)
+    
+    assert qty is None and error.startswith("Invalid quantity format")
+    assert price is None and price_error.startswith("Invalid price format")
+
+def test_repeated_warnings_are_counted_not_repeated(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(validators, '_warn_counts', {})
+    monkeypatch.setattr(validators.logger, 'warning', lambda msg, *args: warnings.append(msg % args if args else msg))
+    
+    for _ in range(validators._WARN_SUMMARY_EVERY):
+        OrderValidator.validate_quantity('0.000000001')
+    
+    assert warnings == [
+        "Very small quantity: 0.000000001",
+        f"Very small quantity: 0.000000001 (seen {validators._WARN_SUMMARY_EVERY}x)",
+    ]
+
+def test_warning_counts_are_bounded(monkeypatch):
+    monkeypatch.setattr(validators, '_warn_counts', {})
+    monkeypatch.setattr(validators.logger, 'warning', lambda *args: None)
+    
+    for i in range(validators._WARN_KEYS_MAX + 10):
+        validators._warn_once(f"warning {i}")
+    
+    assert len(validators._warn_counts) <= validators._WARN_KEYS_MAX
+
+@pytest.mark.parametrize('side', ['BUY', 'sell'])
+def test_sides_are_case_insensitive(side):
+    assert OrderValidator.validate_side(side) == (True, "")
+    assert OrderValidator.validate_stop_limit('BTCUSDT', side, '1', '106', '105')[1]['side'] == side.upper()
+
+@pytest.mark.parametrize('side', ['', ' BUY', 'HOLD'])
+def test_side_validators_agree_on_rejections(side):
+    assert not OrderValidator.validate_side(side)[0]
+    is_valid, parsed = OrderValidator.validate_stop_limit('BTCUSDT', side, '1', '106', '105')
+    assert not is_valid and parsed['error_code'] == 'INVALID_SIDE'
+
+@pytest.mark.parametrize('value, error', [
+    ('', "Quantity cannot be empty"),
+    ('abc', "Invalid quantity format: abc"),
+    ('1.2.3', "Invalid quantity format: 1.2.3"),
+    ('-1', "Quantity must be positive"),
+    ('0', "Quantity must be positive"),
+    ('1000001', "Quantity too large"),
+])
+def test_quantity_errors(value, error):
+    qty, message = OrderValidator.validate_quantity(value)
+    
+    assert qty is None
+    assert message.startswith(error)
+
+def test_price_bounds():
+    assert OrderValidator.validate_price('99', min_price=Decimal('100'))[1].startswith("Price below minimum")
+    assert OrderValidator.validate_price('101', max_price=Decimal('100'))[1].startswith("Price above maximum")
+    assert OrderValidator.validate_price('2000000000')[1].startswith("Price too large")
+
+@pytest.mark.parametrize('quantity, price, is_valid', [
+    ('0.001', '100000', True),  # Exactly on the minimum
+    ('0.00099999', '100000', False),  # Clearly below: float path
+    ('0.000999999999', '100000', False),  # 1e-7 below: exact Decimal recheck
+    ('99.9999999999999999999', '1', False),  # Rounds to 100.0 as a float, still below exactly
+    ('0.1', '1000', True),  # 100.00000000000001 as a float
+    ('2', '100', True),
+])
+def test_notional_at_the_minimum(quantity, price, is_valid):
+    assert OrderValidator.validate_notional(Decimal(quantity), Decimal(price))[0] is is_valid
+
+def test_notional_error_reports_minimum_quantity():
+    _, error = OrderValidator.validate_notional(Decimal('0.0005'), Decimal('100000'))
+    
+    assert "Order value ($50.00) is below Binance minimum of $100" in error
+    assert "Minimum quantity for this price: 0.001000" in error